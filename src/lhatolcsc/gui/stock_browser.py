@@ -5,6 +5,7 @@ Stock Browser Window - Debug tool for viewing mock server inventory.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import re
 from typing import Optional
 from io import BytesIO
 import requests
@@ -21,6 +22,9 @@ from lhatolcsc.gui.search_history import SearchHistoryManager
 
 logger = logging.getLogger(__name__)
 
+# Everything but digits, '.' and '-', stripped from price cells when sorting
+_PRICE_STRIP_RE = re.compile(r"[^\d.-]")
+
 
 class StockBrowserWindow:
     """Window for browsing stock from LCSC API (debug feature)."""
@@ -1016,9 +1020,7 @@ class StockBrowserWindow:
                     return None  # Use None to handle empty separately
                 try:
                     # Remove currency symbols except decimal point
-                    import re
-
-                    numeric_str = re.sub(r"[^\d.-]", "", val)
+                    numeric_str = _PRICE_STRIP_RE.sub("", val)
                     if numeric_str:
                         return float(numeric_str)
                     return None
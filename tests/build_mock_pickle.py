@@ -0,0 +1,57 @@
+"""
+Convert Mock Products JSON to a Pickle File
+
+The mock server parses mock_products_large.json on every start (and in
+every Gunicorn worker). Unpickling the same data is several times faster,
+so this script writes a one-time pickled copy next to the JSON file.
+
+Usage:
+    cd tests
+    python build_mock_pickle.py
+
+This will create 'mock_products_large.pkl' in the tests directory. The mock
+server uses it automatically as long as it is newer than the JSON file;
+re-run this script after regenerating the JSON.
+"""
+
+import json
+import os
+import pickle
+import sys
+import time
+
+if __name__ == '__main__':
+    json_file = 'mock_products_large.json'
+    pickle_file = 'mock_products_large.pkl'
+
+    print("=" * 60)
+    print("Mock Products Pickle Builder")
+    print("=" * 60)
+
+    if not os.path.exists(json_file):
+        print(f"\n❌ Error: {json_file} not found")
+        print("\nPlease ensure you are running this script from the tests/ directory")
+        print("and that mock_products_large.json exists.")
+        sys.exit(1)
+
+    print(f"\nConverting {json_file} to {pickle_file}...")
+
+    start = time.time()
+    with open(json_file, 'r', encoding='utf-8') as f:
+        products = json.load(f)
+    json_time = time.time() - start
+
+    with open(pickle_file, 'wb') as f:
+        pickle.dump(products, f, protocol=5)
+
+    start = time.time()
+    with open(pickle_file, 'rb') as f:
+        pickle.load(f)
+    pickle_time = time.time() - start
+
+    print("\n" + "=" * 60)
+    print(f"✓ Pickled {len(products):,} products")
+    print("=" * 60)
+    print(f"\nJSON load time:   {json_time:.2f}s")
+    print(f"Pickle load time: {pickle_time:.2f}s")
+    print("\nRestart the mock server to pick up the new file.")
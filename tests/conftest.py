@@ -0,0 +1,122 @@
+"""
+Shared pytest fixtures.
+
+The mock database and the API client are created once per test session and
+shared by every test that needs them, instead of once per test script.
+Tests marked ``gui`` are skipped when no display is available, and their
+Tk main loop closes itself shortly after starting so they do not block;
+tests that take ``tk_root`` share a single hidden Tk root instead.
+"""
+
+import os
+import sys
+import tkinter as tk
+
+import pytest
+import requests
+
+# Test scripts import the mock server helpers (e.g. mock_db) as top-level modules
+TESTS_DIR = os.path.dirname(__file__)
+sys.path.insert(0, TESTS_DIR)
+
+# Mock LCSC server (tests/mock_lcsc_server.py) and its credentials
+MOCK_SERVER_URL = "http://localhost:5000"
+MOCK_API_KEY = "test_api_key_12345"
+MOCK_API_SECRET = "test_api_secret_67890"
+
+
+@pytest.fixture(scope="session")
+def mock_database():
+    """SQLite mock product database (tests/mock_products.db).
+
+    Skips the test if the database has not been built or holds no products;
+    MockDatabase would otherwise create an empty one.
+    """
+    from mock_db import MockDatabase
+
+    db_path = os.path.join(TESTS_DIR, 'mock_products.db')
+    if not os.path.exists(db_path):
+        pytest.skip(f"Mock product database not found: {db_path}")
+
+    db = MockDatabase(db_path)
+    if db.get_stats()["total_products"] == 0:
+        db.close()
+        pytest.skip(f"Mock product database is empty: {db_path}")
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def lcsc_client():
+    """API client for the mock LCSC server; skips the test if it is not running."""
+    from lhatolcsc.api.client import LCSCClient
+
+    try:
+        requests.get(f"{MOCK_SERVER_URL}/health", timeout=2)
+    except requests.RequestException:
+        pytest.skip(f"Mock LCSC server is not running on {MOCK_SERVER_URL}")
+
+    client = LCSCClient(
+        api_key=MOCK_API_KEY,
+        api_secret=MOCK_API_SECRET,
+        base_url=MOCK_SERVER_URL
+    )
+    yield client
+    client.session.close()
+
+
+@pytest.fixture(scope="session")
+def mock_api_client():
+    """API client for GUI tests; they only need one, not a running server."""
+    from lhatolcsc.api.client import LCSCClient
+
+    client = LCSCClient(
+        base_url=MOCK_SERVER_URL,
+        api_key="test",
+        api_secret="test"
+    )
+    yield client
+    client.session.close()
+
+
+@pytest.fixture(scope="session")
+def tk_session_root():
+    """Hidden Tk root shared by all GUI tests (one Tcl interpreter per run)."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("No display available for Tk")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def tk_root(tk_session_root):
+    """The shared Tk root; windows a test opens on it are closed afterwards."""
+    yield tk_session_root
+    for child in tk_session_root.winfo_children():
+        child.destroy()
+
+
+# How long a GUI test's main loop runs before its window is closed (ms)
+GUI_TEST_RUN_MS = 100
+
+
+@pytest.fixture(autouse=True)
+def headless_gui(request, monkeypatch):
+    """Skip gui tests without a display and make their mainloop() return."""
+    if request.node.get_closest_marker("gui") is None:
+        return
+
+    # Skips the test when there is no display, without a Tk() of its own
+    request.getfixturevalue("tk_session_root")
+
+    mainloop = tk.Misc.mainloop
+
+    def run_briefly(self, n=0):
+        self.update()
+        self.after(GUI_TEST_RUN_MS, self.destroy)
+        mainloop(self, n)
+
+    monkeypatch.setattr(tk.Misc, "mainloop", run_briefly)
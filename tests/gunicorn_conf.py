@@ -0,0 +1,51 @@
+"""
+Gunicorn configuration for the Mock LCSC API Server
+
+``python tests/mock_lcsc_server.py`` serves the app from a single process,
+which throttles heavily concurrent test clients. For load tests, serve the
+same app with several Gunicorn worker processes instead.
+
+Usage:
+    gunicorn -c tests/gunicorn_conf.py mock_lcsc_server:app
+
+Gunicorn does not run on Windows; run the script directly there.
+"""
+
+import gc
+import os
+
+# Serve from the tests/ directory so ``mock_lcsc_server`` and ``mock_db`` import
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+bind = os.environ.get('MOCK_SERVER_BIND', '127.0.0.1:5000')
+
+# Threaded workers suit Flask; the workload is mostly JSON encoding and I/O
+workers = max(2, (os.cpu_count() or 1) * 2 + 1)
+worker_class = 'gthread'
+threads = 8
+keepalive = 5
+
+# Load the product database once in the master; workers share its pages
+preload_app = True
+
+
+def when_ready(server):
+    """Move the preloaded database out of the GC's reach before forking.
+
+    Otherwise every worker's first collection touches the header of each
+    product object and copies the shared pages into private memory.
+    """
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Give each worker its own SQLite connection.
+
+    The preloaded app opened ``DB_INSTANCE`` in the master, and an SQLite
+    connection must not be used across ``fork()``.
+    """
+    import mock_lcsc_server
+    from mock_db import MockDatabase
+
+    if mock_lcsc_server.DB_INSTANCE is not None:
+        mock_lcsc_server.DB_INSTANCE = MockDatabase(mock_lcsc_server.DB_PATH)
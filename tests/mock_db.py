@@ -16,8 +16,12 @@ Usage:
 import sqlite3
 import json
 import os
+from itertools import islice
 from typing import Dict, Any, Optional
 
+# Products per executemany() batch when importing
+IMPORT_BATCH_SIZE = 10000
+
 
 class MockDatabase:
     """SQLite-based product database for fast searching."""
@@ -27,6 +31,14 @@ class MockDatabase:
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        # Per-connection settings only (nothing is stored in the database
+        # file): fewer fsyncs, and temp tables/sorts and a 64 MB page cache
+        # kept in memory
+        self.conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        """)
         self._create_tables()
         self._create_indexes()
 
@@ -116,92 +128,119 @@ class MockDatabase:
         with open(json_path, 'r', encoding='utf-8') as f:
             products = json.load(f)
 
-        # Clear existing data
+        return self.import_products(products)
+
+    def import_products(self, products: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Replace the database contents with products (keyed by product code).
+
+        Rows are inserted with executemany in batches of IMPORT_BATCH_SIZE
+        products, all in one transaction.
+        """
         cursor = self.conn.cursor()
+
+        # Clear existing data
         cursor.execute("DELETE FROM products")
         cursor.execute("DELETE FROM price_tiers")
         cursor.execute("DELETE FROM parameters")
         cursor.execute("DELETE FROM products_fts")
 
+        items = iter(products.items())
         count = 0
-        for product_code, product in products.items():
-            # Create searchable text (all fields concatenated)
-            search_text = ' '.join([
-                str(product.get('productCode', '')),
-                str(product.get('productModel', '')),
-                str(product.get('productName', '')),
-                str(product.get('brandName', '')),
-                str(product.get('packageType', '')),
-                str(product.get('productIntroEn', '')),
-                str(product.get('parentCatalogName', '')),
-            ]).lower()
-
-            # Insert main product
-            cursor.execute("""
+        while True:
+            batch = list(islice(items, IMPORT_BATCH_SIZE))
+            if not batch:
+                break
+
+            product_rows = []
+            fts_rows = []
+            price_rows = []
+            param_rows = []
+            for product_code, product in batch:
+                # Create searchable text (all fields concatenated)
+                search_text = ' '.join([
+                    str(product.get('productCode', '')),
+                    str(product.get('productModel', '')),
+                    str(product.get('productName', '')),
+                    str(product.get('brandName', '')),
+                    str(product.get('packageType', '')),
+                    str(product.get('productIntroEn', '')),
+                    str(product.get('parentCatalogName', '')),
+                ]).lower()
+
+                product_rows.append((
+                    product_code,
+                    product.get('productModel', ''),
+                    product.get('productName', ''),
+                    product.get('brandName', ''),
+                    product.get('packageType', ''),
+                    product.get('productUnit', ''),
+                    product.get('minPacketUnit', ''),
+                    product.get('minBuyNumber', ''),
+                    product.get('stockNumber', ''),
+                    product.get('productIntroEn', ''),
+                    product.get('parentCatalogName', ''),
+                    json.dumps(product),
+                    search_text
+                ))
+
+                fts_rows.append((
+                    product_code,
+                    product.get('productModel', ''),
+                    product.get('productName', ''),
+                    product.get('brandName', ''),
+                    product.get('packageType', ''),
+                    product.get('productIntroEn', ''),
+                    product.get('parentCatalogName', '')
+                ))
+
+                for price in product.get('productPriceList', []):
+                    price_rows.append((
+                        product_code,
+                        int(price.get('startNumber', 0)),
+                        float(price.get('productPrice', 0)),
+                        price.get('discountRate', '100')
+                    ))
+
+                for param in product.get('paramVOList', []):
+                    param_rows.append((
+                        product_code,
+                        param.get('paramCode', ''),
+                        param.get('paramValue', '')
+                    ))
+
+            # Insert main products
+            cursor.executemany("""
                 INSERT INTO products (
                     product_code, product_model, product_name, brand_name,
                     package_type, product_unit, min_packet_unit, min_buy_number,
                     stock_number, product_intro_en, parent_catalog_name,
                     product_data, search_text
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                product_code,
-                product.get('productModel', ''),
-                product.get('productName', ''),
-                product.get('brandName', ''),
-                product.get('packageType', ''),
-                product.get('productUnit', ''),
-                product.get('minPacketUnit', ''),
-                product.get('minBuyNumber', ''),
-                product.get('stockNumber', ''),
-                product.get('productIntroEn', ''),
-                product.get('parentCatalogName', ''),
-                json.dumps(product),
-                search_text
-            ))
-
-            # Insert FTS entry
-            cursor.execute("""
+            """, product_rows)
+
+            # Insert FTS entries
+            cursor.executemany("""
                 INSERT INTO products_fts (
                     product_code, product_model, product_name, brand_name,
                     package_type, product_intro_en, parent_catalog_name
                 ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                product_code,
-                product.get('productModel', ''),
-                product.get('productName', ''),
-                product.get('brandName', ''),
-                product.get('packageType', ''),
-                product.get('productIntroEn', ''),
-                product.get('parentCatalogName', '')
-            ))
+            """, fts_rows)
 
             # Insert price tiers
-            for price in product.get('productPriceList', []):
-                cursor.execute("""
-                    INSERT INTO price_tiers (product_code, start_number, product_price, discount_rate)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    product_code,
-                    int(price.get('startNumber', 0)),
-                    float(price.get('productPrice', 0)),
-                    price.get('discountRate', '100')
-                ))
+            cursor.executemany("""
+                INSERT INTO price_tiers (product_code, start_number, product_price, discount_rate)
+                VALUES (?, ?, ?, ?)
+            """, price_rows)
 
             # Insert parameters
-            for param in product.get('paramVOList', []):
-                cursor.execute("""
-                    INSERT INTO parameters (product_code, param_code, param_value)
-                    VALUES (?, ?, ?)
-                """, (
-                    product_code,
-                    param.get('paramCode', ''),
-                    param.get('paramValue', '')
-                ))
+            cursor.executemany("""
+                INSERT INTO parameters (product_code, param_code, param_value)
+                VALUES (?, ?, ?)
+            """, param_rows)
 
-            count += 1
-            if count % 1000 == 0:
-                print(f"  Imported {count} products...")
+            count += len(batch)
+            print(f"  Imported {count} products...")
 
         self.conn.commit()
         print(f"✓ Successfully imported {count} products")
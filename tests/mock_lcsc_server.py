@@ -7,21 +7,123 @@ Run this server locally and point your application to http://localhost:5000
 Usage:
     python tests/mock_lcsc_server.py
 
+    # Multi-worker server for load tests (Linux/macOS)
+    gunicorn -c tests/gunicorn_conf.py mock_lcsc_server:app
+
 Mock Credentials:
     API Key: test_api_key_12345
     API Secret: test_api_secret_67890
+
+Environment:
+    MOCK_DISABLE_AUTH=1  Skip credential checks (for automated test suites)
+    MOCK_SERVER_DEV=1    Use the Flask development server even if waitress
+                         is installed
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from rapidfuzz import fuzz, process
+from werkzeug.serving import WSGIRequestHandler
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import Future
+from functools import lru_cache
+import hashlib
+import heapq
 import time
 import json
 import os
+import pickle
+import random
+import re
 import threading
 import sys
-from typing import Dict, Any
+from operator import itemgetter
+from typing import Dict, Any, List, Tuple
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+if orjson is not None:
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson (much faster on product lists)."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+
+def json_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Compress large JSON responses (search and batch results) when the client
+# accepts it; zstd needs flask-compress 1.15+
+if Compress is not None:
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'zstd', 'gzip']
+    Compress(app)
+
+# Text normalization tables for search (built once, applied per call).
+# Single-character substitutions are done in one str.translate() pass; the
+# multi-character mojibake sequences are matched by a single alternation regex.
+_NORMALIZE_TABLE = str.maketrans({
+    'ω': 'ohm',
+    'µ': 'u', 'μ': 'u',
+    '°': 'deg',
+    '±': '+/-',
+    '≤': '<=',
+    '≥': '>=',
+})
+_MOJIBAKE_REPLACEMENTS = {
+    'î©': 'ohm',
+    'âµ': 'u',
+    'â°': 'deg',
+    'â±': '+/-',
+    'â‰¤': '<=',
+    'â‰¥': '>=',
+}
+_MOJIBAKE_RE = re.compile('|'.join(map(re.escape, _MOJIBAKE_REPLACEMENTS)))
+
+
+@lru_cache(maxsize=8192)
+def normalize_text(text):
+    """Normalize text for better searching.
+
+    Memoized because keywords and short field values ("10k", "0603",
+    "samsung") repeat across requests.
+    """
+    text = str(text).lower()
+    # Most text is plain ASCII, which has nothing to replace
+    if not text.isascii():
+        text = text.translate(_NORMALIZE_TABLE)
+        # Replace mojibake sequences with common equivalents in one pass
+        text = _MOJIBAKE_RE.sub(lambda m: _MOJIBAKE_REPLACEMENTS[m.group()], text)
+    # Remove extra whitespace
+    return ' '.join(text.split())
+
+
+def fuzzy_ratio(s1, s2):
+    """Calculate similarity ratio between two normalized strings (0.0 to 1.0)."""
+    return fuzz.ratio(s1, s2) / 100.0
+
+
 # Server control flag
 server_running = True
 
@@ -29,6 +131,24 @@ server_running = True
 VALID_API_KEY = "test_api_key_12345"
 VALID_API_SECRET = "test_api_secret_67890"
 
+# Test suites can set MOCK_DISABLE_AUTH=1 to skip the credential checks
+AUTH_DISABLED = os.environ.get('MOCK_DISABLE_AUTH') == '1'
+
+
+def load_products_file(json_path: str) -> Dict[str, Any]:
+    """Load a product JSON file, preferring an up-to-date pickled copy.
+
+    build_mock_pickle.py writes the pickle next to the JSON file; it loads
+    several times faster than parsing the JSON.
+    """
+    pickle_path = os.path.splitext(json_path)[0] + '.pkl'
+    if os.path.exists(pickle_path) and os.path.getmtime(pickle_path) >= os.path.getmtime(json_path):
+        with open(pickle_path, 'rb') as f:
+            return pickle.load(f)
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 # Try to use SQLite database first (much faster), fallback to JSON
 USE_DATABASE = False
 DB_INSTANCE = None
@@ -60,8 +180,7 @@ if not USE_DATABASE:
     print("Loading product database from JSON...")
     LARGE_DB_PATH = os.path.join(os.path.dirname(__file__), 'mock_products_large.json')
     if os.path.exists(LARGE_DB_PATH):
-        with open(LARGE_DB_PATH, 'r') as f:
-            MOCK_PRODUCTS_LARGE = json.load(f)
+        MOCK_PRODUCTS_LARGE = load_products_file(LARGE_DB_PATH)
         print(f"Loaded {len(MOCK_PRODUCTS_LARGE)} products from {LARGE_DB_PATH}")
     else:
         print(f"Large database not found at {LARGE_DB_PATH}, using small database")
@@ -639,6 +758,306 @@ MOCK_PRODUCTS = {
     }
 }
 
+# Product fields used by the fuzzy search, mapped to their JSON keys
+SEARCH_FIELDS = {
+    'code': 'productCode',
+    'model': 'productModel',
+    'name': 'productName',
+    'brand': 'brandName',
+    'package': 'packageType',
+    'intro': 'productIntroEn',
+    'category': 'parentCatalogName',
+}
+
+# Fuzzy match boosts for the more specific fields (others count 1.0)
+FIELD_BOOSTS = {
+    'code': 1.5,   # Boost code and model matches
+    'model': 1.5,
+    'name': 1.2,   # Boost name and brand matches
+    'brand': 1.2,
+}
+
+# Search data derived from the active database (see rebuild_search_data):
+# - SEARCH_CODES: product codes, indexed by product ordinal
+# - SEARCH_COLUMNS: one list of normalized text per search field
+#   (struct-of-arrays), indexed by the same ordinal, so indexing and the
+#   search command never touch the full product dicts or re-normalize anything
+# - PRODUCT_JSON: pre-serialized JSON per product code; search responses are
+#   assembled by joining these bytes
+# - INVERTED_INDEX: every token of the normalized search fields mapped to the
+#   ordinals of the products containing it; TOKEN_LIST holds its keys
+# - FUZZY_VALUES / FUZZY_WORDS: per field, the normalized values (up to 100
+#   chars) and their words that keyword_scores fuzzy-matches, mapped to ordinals
+# - FUZZY_VALUE_TEXTS / FUZZY_WORD_TEXTS: per field, the keys of the above
+#   sorted by length plus their lengths, so a keyword only scans texts whose
+#   length leaves the similarity threshold within reach
+# - DB_LOADED_AT: when the search data was last rebuilt; sent as Last-Modified
+SEARCH_CODES: List[str] = []
+SEARCH_COLUMNS: Dict[str, List[str]] = {}
+PRODUCT_JSON: Dict[str, bytes] = {}
+INVERTED_INDEX: Dict[str, List[int]] = {}
+TOKEN_LIST: List[str] = []
+FUZZY_VALUES: Dict[str, Dict[str, List[int]]] = {}
+FUZZY_WORDS: Dict[str, Dict[str, List[int]]] = {}
+FUZZY_VALUE_TEXTS: Dict[str, Tuple[List[str], List[int]]] = {}
+FUZZY_WORD_TEXTS: Dict[str, Tuple[List[str], List[int]]] = {}
+DB_LOADED_AT: float = 0.0
+
+
+def _add_posting(index: Dict[str, List[int]], key: str, ordinal: int):
+    """Append ordinal to index[key] unless it was the last one added."""
+    postings = index.get(key)
+    if postings is None:
+        index[key] = [ordinal]
+    elif postings[-1] != ordinal:
+        postings.append(ordinal)
+
+
+def _sort_by_length(texts) -> Tuple[List[str], List[int]]:
+    """Return texts sorted by length, with the matching list of lengths."""
+    texts = sorted(texts, key=len)
+    return texts, [len(text) for text in texts]
+
+
+def _texts_in_length_range(texts_by_length: Tuple[List[str], List[int]], min_len: int, max_len: int) -> List[str]:
+    """Return the texts of a _sort_by_length() pair whose length is within bounds."""
+    texts, lengths = texts_by_length
+    return texts[bisect_left(lengths, min_len):bisect_right(lengths, max_len)]
+
+
+def rebuild_search_data():
+    """Rebuild the search data from the active product database."""
+    global SEARCH_CODES, SEARCH_COLUMNS, PRODUCT_JSON, DB_LOADED_AT
+    global INVERTED_INDEX, TOKEN_LIST, FUZZY_VALUES, FUZZY_WORDS, FUZZY_VALUE_TEXTS, FUZZY_WORD_TEXTS
+    db = MOCK_PRODUCTS_LARGE if MOCK_PRODUCTS_LARGE else MOCK_PRODUCTS
+    products = db.values()
+
+    SEARCH_CODES = list(db)
+    SEARCH_COLUMNS = {
+        field: [normalize_text(product.get(key, '')) for product in products]
+        for field, key in SEARCH_FIELDS.items()
+    }
+    PRODUCT_JSON = {
+        code: json_bytes(product)
+        for code, product in db.items()
+    }
+
+    INVERTED_INDEX = {}
+    FUZZY_VALUES = {field: {} for field in SEARCH_FIELDS}
+    FUZZY_WORDS = {field: {} for field in SEARCH_FIELDS}
+    for field, column in SEARCH_COLUMNS.items():
+        values, words = FUZZY_VALUES[field], FUZZY_WORDS[field]
+        for ordinal, value in enumerate(column):
+            if not value:
+                continue
+            tokens = value.split()
+            for token in tokens:
+                _add_posting(INVERTED_INDEX, token, ordinal)
+            if len(value) <= 100:
+                _add_posting(values, value, ordinal)
+                for word in tokens:
+                    if len(word) >= 4:
+                        _add_posting(words, word, ordinal)
+    TOKEN_LIST = sorted(INVERTED_INDEX)
+    FUZZY_VALUE_TEXTS = {field: _sort_by_length(values) for field, values in FUZZY_VALUES.items()}
+    FUZZY_WORD_TEXTS = {field: _sort_by_length(words) for field, words in FUZZY_WORDS.items()}
+    DB_LOADED_AT = time.time()
+    keyword_scores.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def keyword_scores(keyword: str) -> Dict[int, float]:
+    """Score one normalized keyword against every product it matches.
+
+    Returns {ordinal: score}. A keyword that is a substring of a product's
+    fields (and so of one of its tokens) scores 1.0. Otherwise keywords of 4+
+    chars are fuzzy-matched against each field of up to 100 chars, as a whole
+    and word by word (words of 4+ chars within 3 chars of the keyword's
+    length); the best ratio, weighted by FIELD_BOOSTS, counts if it reaches
+    0.75. Each distinct text is scored once, in bulk, for all the products
+    that share it.
+    """
+    scores = {}
+    if len(keyword) >= 4:
+        for field in SEARCH_FIELDS:
+            boost = FIELD_BOOSTS.get(field, 1.0)
+            # Let rapidfuzz filter the texts in bulk with a slightly loose
+            # cutoff, then apply the exact threshold
+            cutoff = 75.0 / boost - 0.01
+            # The ratio is at most 2*min(len)/sum(len), which bounds the
+            # lengths of texts that can reach the cutoff (with 1 char slack)
+            min_ratio = cutoff / 100.0
+            min_len = int(len(keyword) * min_ratio / (2 - min_ratio)) - 1
+            max_len = int(len(keyword) * (2 - min_ratio) / min_ratio) + 1
+            values, words = FUZZY_VALUES[field], FUZZY_WORDS[field]
+            value_choices = _texts_in_length_range(FUZZY_VALUE_TEXTS[field], min_len, max_len)
+            word_choices = _texts_in_length_range(
+                FUZZY_WORD_TEXTS[field], max(min_len, len(keyword) - 3), min(max_len, len(keyword) + 3))
+            matches = [
+                (score, values[text]) for text, score, _ in process.extract(
+                    keyword, value_choices, scorer=fuzz.ratio, score_cutoff=cutoff, limit=None)
+            ]
+            matches += [
+                (score, words[word]) for word, score, _ in process.extract(
+                    keyword, word_choices, scorer=fuzz.ratio, score_cutoff=cutoff, limit=None)
+            ]
+            for score, postings in matches:
+                field_score = score / 100.0 * boost
+                if field_score >= 0.75:
+                    for ordinal in postings:
+                        if scores.get(ordinal, 0.0) < field_score:
+                            scores[ordinal] = field_score
+
+    # Substring matches take precedence over fuzzy ones
+    for token in TOKEN_LIST:
+        if keyword in token:
+            for ordinal in INVERTED_INDEX[token]:
+                scores[ordinal] = 1.0
+
+    return scores
+
+
+# Aggregates of MOCK_PRODUCTS_LARGE for the stats, categories and brands
+# commands, recomputed only when the database is (re)loaded
+CATEGORY_COUNTS: Counter = Counter()
+BRAND_COUNTS: Counter = Counter()
+CATEGORY_NAMES: List[str] = []
+BRAND_NAMES: List[str] = []
+TOTAL_STOCK = 0
+
+
+def rebuild_database_stats():
+    """Recompute the category, brand and stock aggregates of the large database."""
+    global CATEGORY_COUNTS, BRAND_COUNTS, CATEGORY_NAMES, BRAND_NAMES, TOTAL_STOCK
+    products = MOCK_PRODUCTS_LARGE.values()
+    CATEGORY_COUNTS = Counter(product.get('parentCatalogName', 'Unknown') for product in products)
+    BRAND_COUNTS = Counter(product.get('brandName', 'Unknown') for product in products)
+    CATEGORY_NAMES = sorted(filter(None, {product.get('parentCatalogName') for product in products}))
+    BRAND_NAMES = sorted(filter(None, {product.get('brandName') for product in products}))
+    TOTAL_STOCK = sum(int(product.get('stockNumber', 0)) for product in products)
+
+
+rebuild_search_data()
+rebuild_database_stats()
+
+
+def build_search_body(total: int, current_page: int, page_size: int, codes) -> bytes:
+    """Build a search response body from the pre-serialized products."""
+    return (
+        b'{"success":true,"code":200,"message":"Success","result":'
+        b'{"total":%d,"current_page":%d,"page_size":%d,"productList":['
+        % (total, current_page, page_size)
+        + b','.join(PRODUCT_JSON[code] for code in codes)
+        + b']}}'
+    )
+
+
+def cacheable_response(body: bytes, etag: str) -> Response:
+    """Return a cacheable JSON response, or 304 if the client's copy is current."""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.last_modified = DB_LOADED_AT
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
+
+
+# Shared stand-in for a missing or invalid JSON body (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+
+def int_param(data, name: str, default: int) -> int:
+    """Return an integer request parameter, or the default if it is missing or invalid."""
+    try:
+        return int(data.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# Searches currently being computed, keyed by (keyword, page, page_size).
+# Concurrent identical requests wait for the first one to finish instead of
+# repeating the fuzzy scoring.
+_INFLIGHT_SEARCHES: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def run_coalesced(key: tuple, compute):
+    """Run compute() once for all concurrent callers sharing the same key."""
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT_SEARCHES.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _INFLIGHT_SEARCHES[key] = Future()
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = compute()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT_SEARCHES[key]
+
+
+@lru_cache(maxsize=1024)
+def _search_impl(keyword: str, current_page: int, page_size: int) -> tuple:
+    """Run a JSON-database search and return its (response body, ETag).
+
+    Searches are deterministic until the database is reloaded, so results
+    are memoized; reload_database() clears the cache.
+    """
+    # Split keyword into normalized tokens for multi-word search
+    keywords = [normalize_text(kw) for kw in keyword.split()]
+
+    # A product must match every keyword: score only the products present in
+    # all keywords' score maps (in database order). Its score is the average
+    # keyword score weighted 0.7, plus 0.3 for matching all keywords.
+    if len(keywords) == 1:
+        # Single keyword: every product in its score map matches
+        scores = keyword_scores(keywords[0])
+        scored_results = [
+            (scores[ordinal] * 0.7 + 0.3, SEARCH_CODES[ordinal]) for ordinal in sorted(scores)
+        ]
+    elif keywords:
+        scored_results = []
+        keyword_maps = [keyword_scores(kw) for kw in keywords]
+        smallest = min(keyword_maps, key=len)
+        for ordinal in sorted(smallest):
+            total_score = 0.0
+            for scores in keyword_maps:
+                score = scores.get(ordinal)
+                if score is None:
+                    break
+                total_score += score
+            else:
+                avg_score = total_score / len(keywords)
+                scored_results.append((avg_score * 0.7 + 0.3, SEARCH_CODES[ordinal]))
+    else:
+        # Empty search matches all
+        scored_results = [(1.0, code) for code in SEARCH_CODES]
+
+    # Rank by score (highest first). Early pages only need the top `end`
+    # results, which a heap selects without sorting everything; nlargest
+    # keeps the same order as a stable sort.
+    start = (current_page - 1) * page_size
+    end = start + page_size
+    if page_size > 0 and start >= 0 and end * 4 < len(scored_results):
+        ranked = heapq.nlargest(end, scored_results, key=itemgetter(0))
+    else:
+        ranked = sorted(scored_results, key=itemgetter(0), reverse=True)
+
+    # Paginate and extract just the product codes (drop scores)
+    paginated = [code for score, code in ranked[start:end]]
+
+    body = build_search_body(len(scored_results), current_page, page_size, paginated)
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
 
 def verify_signature(api_key: str, api_secret: str, timestamp: str, nonce: str, signature: str) -> bool:
     """Verify the API signature (simplified version)."""
@@ -649,15 +1068,15 @@ def verify_signature(api_key: str, api_secret: str, timestamp: str, nonce: str,
 
 def check_auth() -> Dict[str, Any]:
     """Check authentication from query parameters (LCSC API style)."""
-    # LCSC API uses query parameters: key, timestamp, nonce, signature
-    api_key = request.args.get('key', '')
-    # timestamp = request.args.get('timestamp', '')  # Not used in mock
-    # nonce = request.args.get('nonce', '')  # Not used in mock
-    signature = request.args.get('signature', '')
+    if AUTH_DISABLED:
+        return {"success": True}
 
+    # LCSC API uses query parameters: key, timestamp, nonce, signature
+    # (timestamp and nonce are not used in mock)
+    args = request.args
     # Fallback to headers for backward compatibility
-    if not api_key:
-        api_key = request.headers.get('X-API-KEY', '')
+    api_key = args.get('key') or request.headers.get('X-API-KEY', '')
+    signature = args.get('signature', '')
 
     if not api_key:
         return {
@@ -688,14 +1107,33 @@ def check_auth() -> Dict[str, Any]:
     return {"success": True}
 
 
+# Constant response bodies, serialized once: the 401 errors check_auth can
+# produce (keyed by message) and the health check
+_UNAUTHORIZED_JSON = {
+    message: json_bytes({
+        "success": False,
+        "code": 401,
+        "message": message,
+        "result": None
+    })
+    for message in ("Missing API key", "Invalid API key", "Missing signature")
+}
+_HEALTH_JSON = json_bytes({
+    "status": "ok",
+    "message": "Mock LCSC API Server is running",
+    "version": "1.0.0"
+})
+
+
+def unauthorized(auth: Dict[str, Any]) -> Response:
+    """Return the pre-serialized 401 response for a failed check_auth() result."""
+    return Response(_UNAUTHORIZED_JSON[auth["message"]], status=401, mimetype='application/json')
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
-    return jsonify({
-        "status": "ok",
-        "message": "Mock LCSC API Server is running",
-        "version": "1.0.0"
-    })
+    return Response(_HEALTH_JSON, mimetype='application/json')
 
 
 @app.route('/rest/wmsc2agent/search/product', methods=['POST', 'GET'])
@@ -705,17 +1143,17 @@ def search_products():
 
     auth = check_auth()
     if not auth.get("success"):
-        return jsonify(auth), 401
+        return unauthorized(auth)
 
     # Get search parameters (LCSC uses different param names)
     if request.method == 'POST':
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or _EMPTY
     else:
-        data = request.args.to_dict()
+        data = request.args
 
-    keyword = data.get('keyword', '').strip()
-    current_page = int(data.get('current_page', 1))
-    page_size = int(data.get('page_size', 10))
+    keyword = (data.get('keyword') or '').strip()
+    current_page = int_param(data, 'current_page', 1)
+    page_size = int_param(data, 'page_size', 10)
 
     # Use database if available (much faster!)
     if USE_DATABASE and DB_INSTANCE:
@@ -724,12 +1162,13 @@ def search_products():
             elapsed = time.time() - start_time
             print(f"DB Search for '{keyword}' completed in {elapsed:.3f}s - {result['total']} results")
 
-            return jsonify({
+            body = json_bytes({
                 "success": True,
                 "code": 200,
                 "message": "Success",
                 "result": result
             })
+            return cacheable_response(body, hashlib.blake2b(body, digest_size=16).hexdigest())
         except Exception as e:
             print(f"Database search error: {e}")
             import traceback
@@ -737,163 +1176,9 @@ def search_products():
             # Fall through to JSON search
 
     # Fallback to original JSON-based search
-    from difflib import SequenceMatcher
-
-    def fuzzy_ratio(s1, s2):
-        """Calculate similarity ratio between two strings (0.0 to 1.0)."""
-        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
-
-    def normalize_text(text):
-        """Normalize text for better searching."""
-        text = str(text).lower()
-        # Replace special characters with common equivalents
-        text = text.replace('ω', 'ohm').replace('ω', 'ohm').replace('î©', 'ohm')
-        text = text.replace('µ', 'u').replace('μ', 'u').replace('âµ', 'u')
-        text = text.replace('°', 'deg').replace('â°', 'deg')
-        text = text.replace('±', '+/-').replace('â±', '+/-')
-        text = text.replace('≤', '<=').replace('â‰¤', '<=')
-        text = text.replace('≥', '>=').replace('â‰¥', '>=')
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        return text
-
-    def score_product(product, keywords):
-        """Score a product against search keywords using fuzzy matching."""
-        # Extract all searchable fields
-        fields = {
-            'code': product.get('productCode', ''),
-            'model': product.get('productModel', ''),
-            'name': product.get('productName', ''),
-            'brand': product.get('brandName', ''),
-            'package': product.get('packageType', ''),
-            'intro': product.get('productIntroEn', ''),
-            'category': product.get('parentCatalogName', ''),
-        }
-
-        # Normalize all fields
-        normalized_fields = {k: normalize_text(v) for k, v in fields.items()}
-
-        # Combine all text for full-text search
-        combined_text = ' '.join(normalized_fields.values())
-
-        total_score = 0.0
-        keyword_matches = 0
-
-        for keyword in keywords:
-            keyword = normalize_text(keyword)
-            best_field_score = 0.0
-
-            # Check exact substring match first (highest priority)
-            if keyword in combined_text:
-                best_field_score = 1.0
-                keyword_matches += 1
-            else:
-                # Try fuzzy matching on each field
-                for field_name, field_value in normalized_fields.items():
-                    if not field_value:
-                        continue
-
-                    # Check if keyword is substring
-                    if keyword in field_value:
-                        field_score = 1.0
-                    else:
-                        # Fuzzy match: ONLY if keyword is substantial (4+ chars)
-                        # and field is not too long (to avoid false positives)
-                        if len(keyword) >= 4 and len(field_value) <= 100:
-                            # Fuzzy match the whole field
-                            field_score = fuzzy_ratio(keyword, field_value)
-
-                            # Also try fuzzy matching against individual words in the field
-                            words = field_value.split()
-                            for word in words:
-                                # Only fuzzy match words of similar length
-                                if len(word) >= 4 and abs(len(word) - len(keyword)) <= 3:
-                                    word_score = fuzzy_ratio(keyword, word)
-                                    if word_score > field_score:
-                                        field_score = word_score
-                        else:
-                            field_score = 0.0
-
-                    # Weight certain fields higher
-                    if field_name in ['code', 'model']:
-                        field_score *= 1.5  # Boost code and model matches
-                    elif field_name in ['name', 'brand']:
-                        field_score *= 1.2  # Boost name and brand matches
-
-                    if field_score > best_field_score:
-                        best_field_score = field_score
-
-                # Only count if above threshold (0.75 = 75% similarity for fuzzy)
-                if best_field_score >= 0.75:
-                    keyword_matches += 1
-
-            total_score += best_field_score
-
-        # Calculate final score
-        if not keywords:
-            return 1.0  # Empty search matches all
-
-        # Average score across all keywords, with bonus for matching all keywords
-        avg_score = total_score / len(keywords)
-        completeness_bonus = keyword_matches / len(keywords)
-
-        # Must match ALL keywords to be included
-        if keyword_matches < len(keywords):
-            return 0.0
-
-        return (avg_score * 0.7) + (completeness_bonus * 0.3)
-
-    auth = check_auth()
-    if not auth.get("success"):
-        return jsonify(auth), 401
-
-    # Get search parameters (LCSC uses different param names)
-    if request.method == 'POST':
-        data = request.get_json() or {}
-    else:
-        data = request.args.to_dict()
-
-    keyword = data.get('keyword', '').strip()
-    current_page = int(data.get('current_page', 1))
-    page_size = int(data.get('page_size', 10))
-
-    # Use large database if available, otherwise use small database
-    db = MOCK_PRODUCTS_LARGE if MOCK_PRODUCTS_LARGE else MOCK_PRODUCTS
-
-    # Split keyword into tokens for multi-word search
-    keywords = keyword.split() if keyword else []
-
-    # Score all products
-    scored_results = []
-    for product in db.values():
-        score = score_product(product, keywords)
-
-        # Only include products with score > 0 (all keywords must match)
-        if score > 0:
-            scored_results.append((score, product))
-
-    # Sort by score (highest first)
-    scored_results.sort(reverse=True, key=lambda x: x[0])
-
-    # Extract just the products (drop scores)
-    results = [product for score, product in scored_results]
-
-    # Paginate
-    start = (current_page - 1) * page_size
-    end = start + page_size
-    paginated = results[start:end]
-
-    return jsonify({
-        "success": True,
-        "code": 200,
-        "message": "Success",
-        "result": {
-            "total": len(results),
-            "current_page": current_page,
-            "page_size": page_size,
-            "productList": paginated  # Changed from "list" to "productList"
-        }
-    })
+    key = (keyword, current_page, page_size)
+    body, etag = run_coalesced(key, lambda: _search_impl(*key))
+    return cacheable_response(body, etag)
 
 
 @app.route('/rest/wmsc2agent/product/info/<product_code>', methods=['GET'])
@@ -901,17 +1186,18 @@ def get_product_detail(product_code: str):
     """Get product detail by product code - matches real LCSC API."""
     auth = check_auth()
     if not auth.get("success"):
-        return jsonify(auth), 401
+        return unauthorized(auth)
 
     # Use database if available
     if USE_DATABASE and DB_INSTANCE:
         product = DB_INSTANCE.get_product(product_code)
+        product_json = json_bytes(product) if product else None
     else:
-        # Use large database if available, otherwise use small database
-        db = MOCK_PRODUCTS_LARGE if MOCK_PRODUCTS_LARGE else MOCK_PRODUCTS
-        product = db.get(product_code)
+        # Search data covers the large database if available, otherwise the
+        # small one
+        product_json = PRODUCT_JSON.get(product_code)
 
-    if not product:
+    if not product_json:
         return jsonify({
             "success": False,
             "code": 404,
@@ -919,12 +1205,73 @@ def get_product_detail(product_code: str):
             "result": None
         }), 404
 
-    return jsonify({
-        "success": True,
-        "code": 200,
-        "message": "Success",
-        "result": product
-    })
+    body = b'{"success":true,"code":200,"message":"Success","result":' + product_json + b'}'
+    return cacheable_response(body, hashlib.blake2b(body, digest_size=16).hexdigest())
+
+
+# The category tree and brand list never change, so their response bodies
+# are serialized once
+_CATEGORY_TREE = [
+    {
+        "categoryId": "1",
+        "categoryName": "Resistors",
+        "parentId": "0",
+        "children": [
+            {"categoryId": "101", "categoryName": "Chip Resistor - Surface Mount", "parentId": "1", "children": []},
+            {"categoryId": "102", "categoryName": "Through Hole Resistors", "parentId": "1", "children": []}
+        ]
+    },
+    {
+        "categoryId": "2",
+        "categoryName": "Capacitors",
+        "parentId": "0",
+        "children": [
+            {
+                "categoryId": "201",
+                "categoryName": "Multilayer Ceramic Capacitors MLCC - SMD/SMT",
+                "parentId": "2",
+                "children": []
+            },
+            {
+                "categoryId": "202",
+                "categoryName": "Aluminum Electrolytic Capacitors",
+                "parentId": "2",
+                "children": []
+            }
+        ]
+    },
+    {
+        "categoryId": "3",
+        "categoryName": "Integrated Circuits (ICs)",
+        "parentId": "0",
+        "children": [
+            {"categoryId": "301", "categoryName": "Microcontrollers - MCU", "parentId": "3", "children": []},
+            {"categoryId": "302", "categoryName": "Interface ICs", "parentId": "3", "children": []}
+        ]
+    }
+]
+
+_CATEGORY_TREE_JSON = json_bytes({
+    "success": True,
+    "code": 200,
+    "message": "Success",
+    "result": _CATEGORY_TREE
+})
+
+_BRANDS = [
+    {"brandId": "1", "brandName": "UNI-ROYAL(Uniroyal Elec)"},
+    {"brandId": "2", "brandName": "SAMSUNG"},
+    {"brandId": "3", "brandName": "STMicroelectronics"},
+    {"brandId": "4", "brandName": "Texas Instruments"},
+    {"brandId": "5", "brandName": "NXP"},
+]
+
+_BRANDS_JSON = json_bytes({
+    "success": True,
+    "code": 200,
+    "message": "Success",
+    "result": _BRANDS
+})
 
 
 @app.route('/rest/wmsc2agent/category', methods=['GET'])
@@ -932,54 +1279,9 @@ def get_category_tree():
     """Get category tree - matches real LCSC API."""
     auth = check_auth()
     if not auth.get("success"):
-        return jsonify(auth), 401
-
-    categories = [
-        {
-            "categoryId": "1",
-            "categoryName": "Resistors",
-            "parentId": "0",
-            "children": [
-                {"categoryId": "101", "categoryName": "Chip Resistor - Surface Mount", "parentId": "1", "children": []},
-                {"categoryId": "102", "categoryName": "Through Hole Resistors", "parentId": "1", "children": []}
-            ]
-        },
-        {
-            "categoryId": "2",
-            "categoryName": "Capacitors",
-            "parentId": "0",
-            "children": [
-                {
-                    "categoryId": "201",
-                    "categoryName": "Multilayer Ceramic Capacitors MLCC - SMD/SMT",
-                    "parentId": "2",
-                    "children": []
-                },
-                {
-                    "categoryId": "202",
-                    "categoryName": "Aluminum Electrolytic Capacitors",
-                    "parentId": "2",
-                    "children": []
-                }
-            ]
-        },
-        {
-            "categoryId": "3",
-            "categoryName": "Integrated Circuits (ICs)",
-            "parentId": "0",
-            "children": [
-                {"categoryId": "301", "categoryName": "Microcontrollers - MCU", "parentId": "3", "children": []},
-                {"categoryId": "302", "categoryName": "Interface ICs", "parentId": "3", "children": []}
-            ]
-        }
-    ]
+        return unauthorized(auth)
 
-    return jsonify({
-        "success": True,
-        "code": 200,
-        "message": "Success",
-        "result": categories
-    })
+    return Response(_CATEGORY_TREE_JSON, mimetype='application/json')
 
 
 @app.route('/rest/wmsc2agent/brand', methods=['GET'])
@@ -987,22 +1289,9 @@ def get_brands():
     """Get brand list - matches real LCSC API."""
     auth = check_auth()
     if not auth.get("success"):
-        return jsonify(auth), 401
+        return unauthorized(auth)
 
-    brands = [
-        {"brandId": "1", "brandName": "UNI-ROYAL(Uniroyal Elec)"},
-        {"brandId": "2", "brandName": "SAMSUNG"},
-        {"brandId": "3", "brandName": "STMicroelectronics"},
-        {"brandId": "4", "brandName": "Texas Instruments"},
-        {"brandId": "5", "brandName": "NXP"},
-    ]
-
-    return jsonify({
-        "success": True,
-        "code": 200,
-        "message": "Success",
-        "result": brands
-    })
+    return Response(_BRANDS_JSON, mimetype='application/json')
 
 
 # Keep old endpoints for backward compatibility
@@ -1023,25 +1312,19 @@ def batch_products():
     """Get multiple products by product codes - matches real LCSC API."""
     auth = check_auth()
     if not auth.get("success"):
-        return jsonify(auth), 401
+        return unauthorized(auth)
 
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or _EMPTY
     product_codes = data.get('productCodes', [])
 
-    # Use large database if available, otherwise use small database
-    db = MOCK_PRODUCTS_LARGE if MOCK_PRODUCTS_LARGE else MOCK_PRODUCTS
+    # Join the pre-serialized products (large database if available,
+    # otherwise small database); unknown codes are skipped
+    results = [product for product in map(PRODUCT_JSON.get, product_codes) if product is not None]
 
-    results = []
-    for code in product_codes:
-        if code in db:
-            results.append(db[code])
-
-    return jsonify({
-        "success": True,
-        "code": 200,
-        "message": "Success",
-        "result": results
-    })
+    return Response(
+        b'{"success":true,"code":200,"message":"Success","result":[' + b','.join(results) + b']}',
+        mimetype='application/json'
+    )
 
 
 @app.route('/api/test/connection', methods=['GET', 'POST'])
@@ -1049,7 +1332,7 @@ def test_connection():
     """Test API connection endpoint."""
     auth = check_auth()
     if not auth.get("success"):
-        return jsonify(auth), 401
+        return unauthorized(auth)
 
     return jsonify({
         "success": True,
@@ -1122,8 +1405,10 @@ def reload_database():
     print("\nReloading database...")
     try:
         if os.path.exists(LARGE_DB_PATH):
-            with open(LARGE_DB_PATH, 'r', encoding='utf-8') as f:
-                MOCK_PRODUCTS_LARGE = json.load(f)
+            MOCK_PRODUCTS_LARGE = load_products_file(LARGE_DB_PATH)
+            rebuild_search_data()
+            rebuild_database_stats()
+            _search_impl.cache_clear()
             print(f"✓ Successfully reloaded {len(MOCK_PRODUCTS_LARGE):,} products\n")
         else:
             print(f"✗ Database file not found: {LARGE_DB_PATH}\n")
@@ -1131,30 +1416,38 @@ def reload_database():
         print(f"✗ Error reloading database: {e}\n")
 
 
-def show_product_info(product_code):
-    """Show detailed information for a product."""
+# clean_unicode() display substitutions, applied in a single left-to-right
+# regex scan with dict dispatch. Longer (mojibake) sequences are tried first,
+# so 'Â±' becomes '+/-' rather than a stray 'Â' plus '+/-'.
+_CLEAN_MAP = {
+    'Ω': 'ohm', 'Î©': 'ohm',
+    '±': '+/-', 'Â±': '+/-',
+    'µ': 'u', 'Âµ': 'u',
+    '°': 'deg', 'Â°': 'deg',
+    '≤': '<=', 'â‰¤': '<=',
+    '≥': '>=', 'â‰¥': '>=',
+    'Å': 'A',
+    'â€"': '-',
+    'Ã—': 'x',
+}
+_CLEAN_RE = re.compile('|'.join(map(re.escape, sorted(_CLEAN_MAP, key=len, reverse=True))))
 
-    def clean_unicode(text):
-        """Clean Unicode characters for display."""
-        if not text:
-            return text
-        text = str(text)
-        # Replace special characters with ASCII equivalents
-        text = (text
-                .replace('Ω', 'ohm').replace('Î©', 'ohm')
-                .replace('±', '+/-').replace('Â±', '+/-')
-                .replace('µ', 'u').replace('Âµ', 'u')
-                .replace('°', 'deg').replace('Â°', 'deg')
-                .replace('≤', '<=').replace('â‰¤', '<=')
-                .replace('≥', '>=').replace('â‰¥', '>=')
-                .replace('Å', 'A')
-                .replace('â€"', '-')
-                .replace('Ã—', 'x')
-                )
-        # Remove any remaining non-ASCII characters
-        text = text.encode('ascii', 'ignore').decode('ascii')
+
+def clean_unicode(text):
+    """Clean Unicode characters for display."""
+    if not text:
+        return text
+    text = str(text)
+    if text.isascii():
         return text
+    # Replace special characters with ASCII equivalents
+    text = _CLEAN_RE.sub(lambda m: _CLEAN_MAP[m.group()], text)
+    # Remove any remaining non-ASCII characters
+    return text.encode('ascii', 'ignore').decode('ascii')
+
 
+def show_product_info(product_code):
+    """Show detailed information for a product."""
     product_code = product_code.upper().strip()
 
     # Search in large database
@@ -1203,42 +1496,23 @@ def show_product_info(product_code):
 
 def cmd_search_products(keyword, limit=10):
     """Search products by keyword with strict fuzzy matching (command-line version)."""
-    from difflib import SequenceMatcher
-
-    def fuzzy_ratio(s1, s2):
-        """Calculate similarity ratio between two strings."""
-        return SequenceMatcher(None, s1.lower(), s2.lower()).ratio()
-
-    def normalize_text(text):
-        """Normalize text for better searching."""
-        text = str(text).lower()
-        text = text.replace('ω', 'ohm').replace('ω', 'ohm').replace('î©', 'ohm')
-        text = text.replace('µ', 'u').replace('μ', 'u').replace('âµ', 'u')
-        text = text.replace('°', 'deg').replace('â°', 'deg')
-        text = text.replace('±', '+/-').replace('â±', '+/-')
-        text = ' '.join(text.split())
-        return text
-
-    keywords = keyword.lower().split()
+    keywords = [normalize_text(kw) for kw in keyword.lower().split()]
     results = []
 
-    for code, product in MOCK_PRODUCTS_LARGE.items():
-        # Get all searchable fields (including productIntroEn)
-        name = normalize_text(product.get('productName', ''))
-        model = normalize_text(product.get('productModel', ''))
-        brand = normalize_text(product.get('brandName', ''))
-        category = normalize_text(product.get('parentCatalogName', ''))
-        intro = normalize_text(product.get('productIntroEn', ''))
-        code_normalized = normalize_text(code)
+    # Searchable fields (including productIntroEn), already normalized in
+    # the search columns, which cover MOCK_PRODUCTS_LARGE whenever it is loaded
+    columns = [SEARCH_COLUMNS[field] for field in ('name', 'model', 'brand', 'category', 'intro', 'code')]
+    rows = zip(SEARCH_CODES, *columns) if MOCK_PRODUCTS_LARGE else ()
 
-        combined = f"{name} {model} {brand} {category} {intro} {code_normalized}"
+    for code, *fields in rows:
+        product = MOCK_PRODUCTS_LARGE[code]
+        combined = ' '.join(fields)
 
         # Check if all keywords match
         matched_keywords = 0
         total_score = 0.0
 
         for kw in keywords:
-            kw = normalize_text(kw)
             best_score = 0.0
 
             # Exact substring match
@@ -1247,7 +1521,7 @@ def cmd_search_products(keyword, limit=10):
                 matched_keywords += 1
             elif len(kw) >= 4:  # Only fuzzy match longer keywords
                 # Try fuzzy matching on individual fields
-                for field in [name, model, brand, category, intro, code_normalized]:
+                for field in fields:
                     if not field:
                         continue
 
@@ -1299,8 +1573,9 @@ def cmd_search_products(keyword, limit=10):
 
 def show_random_products(count=5):
     """Show random products."""
-    import random
-    codes = list(MOCK_PRODUCTS_LARGE.keys())
+    # Sample from the cached code list (it mirrors MOCK_PRODUCTS_LARGE when
+    # loaded) rather than copying all the dict keys on every call
+    codes = SEARCH_CODES if MOCK_PRODUCTS_LARGE else []
     if len(codes) > count:
         codes = random.sample(codes, count)
     else:
@@ -1317,18 +1592,9 @@ def show_random_products(count=5):
 
 def show_database_stats():
     """Show detailed database statistics."""
-    categories = {}
-    brands = {}
-    total_stock = 0
-
-    for product in MOCK_PRODUCTS_LARGE.values():
-        cat = product.get('parentCatalogName', 'Unknown')
-        categories[cat] = categories.get(cat, 0) + 1
-
-        brand = product.get('brandName', 'Unknown')
-        brands[brand] = brands.get(brand, 0) + 1
-
-        total_stock += int(product.get('stockNumber', 0))
+    categories = CATEGORY_COUNTS
+    brands = BRAND_COUNTS
+    total_stock = TOTAL_STOCK
 
     print("\n" + "=" * 70)
     print("DATABASE STATISTICS")
@@ -1339,11 +1605,11 @@ def show_database_stats():
     print(f"Brands:           {len(brands)}")
 
     print("\nTop 10 Categories:")
-    for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True)[:10]:
+    for cat, count in categories.most_common(10):
         print(f"  {cat:40} {count:>6,} products")
 
     print("\nTop 10 Brands:")
-    for brand, count in sorted(brands.items(), key=lambda x: x[1], reverse=True)[:10]:
+    for brand, count in brands.most_common(10):
         print(f"  {brand:40} {count:>6,} products")
 
     print("=" * 70 + "\n")
@@ -1351,32 +1617,24 @@ def show_database_stats():
 
 def list_categories():
     """List all categories."""
-    categories = set()
-    for product in MOCK_PRODUCTS_LARGE.values():
-        cat = product.get('parentCatalogName')
-        if cat:
-            categories.add(cat)
+    categories = CATEGORY_NAMES
 
     print("\n" + "=" * 70)
     print(f"PRODUCT CATEGORIES ({len(categories)} total)")
     print("=" * 70)
-    for cat in sorted(categories):
+    for cat in categories:
         print(f"  {cat}")
     print("=" * 70 + "\n")
 
 
 def list_brands():
     """List all brands."""
-    brands = set()
-    for product in MOCK_PRODUCTS_LARGE.values():
-        brand = product.get('brandName')
-        if brand:
-            brands.add(brand)
+    brands = BRAND_NAMES
 
     print("\n" + "=" * 70)
     print(f"MANUFACTURER BRANDS ({len(brands)} total)")
     print("=" * 70)
-    for brand in sorted(brands):
+    for brand in brands:
         print(f"  {brand}")
     print("=" * 70 + "\n")
 
@@ -1507,5 +1765,17 @@ if __name__ == '__main__':
     cmd_thread = threading.Thread(target=command_loop, daemon=True)
     cmd_thread.start()
 
-    # Run Flask server (use_reloader=False to prevent duplicate thread)
-    app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+
+    if serve is not None and os.environ.get('MOCK_SERVER_DEV') != '1':
+        # Production WSGI server with a worker thread pool (runs on Windows too)
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+    else:
+        # Speak HTTP/1.1 so test clients can reuse keep-alive connections
+        WSGIRequestHandler.protocol_version = "HTTP/1.1"
+
+        # Run Flask server (use_reloader=False to prevent duplicate thread)
+        app.run(host='127.0.0.1', port=5000, debug=False, use_reloader=False)
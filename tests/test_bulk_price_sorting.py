@@ -6,11 +6,26 @@ This script tests that components are sorted by their cheapest bulk price first.
 
 import sys
 import os
+from itertools import islice, pairwise
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'tests'))
 
 from mock_db import MockDatabase
 
+# Bulk prices by product code; both tests see the same products and their
+# price lists do not change during a run
+_BULK_PRICES = {}
+
 def get_bulk_price(product_data):
+    """Extract the cheapest price at the highest quantity break, cached by product code."""
+    product_code = product_data.get('productCode') if isinstance(product_data, dict) else None
+    if product_code is None:
+        return _compute_bulk_price(product_data)
+    bulk_price = _BULK_PRICES.get(product_code)
+    if bulk_price is None:
+        bulk_price = _BULK_PRICES[product_code] = _compute_bulk_price(product_data)
+    return bulk_price
+
+def _compute_bulk_price(product_data):
     """Extract the cheapest price at the highest quantity break."""
     try:
         price_list = product_data.get('productPriceList', [])
@@ -37,12 +52,11 @@ def get_bulk_price(product_data):
     except Exception:
         return 0
 
-def test_bulk_price_sorting():
+def test_bulk_price_sorting(mock_database):
     """Test that search results are sorted by bulk pricing."""
     print("Testing bulk price sorting...")
     
-    # Initialize database
-    db = MockDatabase()
+    db = mock_database
     
     # Test search for resistors (common components with bulk pricing)
     search_term = "resistor"
@@ -51,43 +65,45 @@ def test_bulk_price_sorting():
     print(f"\nSearch results for '{search_term}' (sorted by bulk price):")
     print("-" * 80)
     
-    previous_bulk_price = 0
+    # Compute the bulk prices for the whole page before printing, and verify
+    # sorting (bulk price should be ascending) in one pass over them
+    bulk_prices = [get_bulk_price(product) for product in results['productList']]
+    out_of_order = {
+        i for i, (previous, current) in enumerate(pairwise(bulk_prices), 2)
+        if current < previous
+    }
     
-    for i, product in enumerate(results['productList'], 1):
+    for i, (product, bulk_price) in enumerate(zip(results['productList'], bulk_prices), 1):
         product_data = product  # Product data is directly in the list item
         product_code = product_data.get('productCode', 'Unknown')
         stock = product_data.get('stockNumber', 0)
-        bulk_price = get_bulk_price(product_data)
         
-        # Get price list for display
-        price_list = product_data.get('productPriceList', [])
-        price_tiers = []
-        for tier in price_list:
-            qty = tier.get('endAmount', 0)
-            price = tier.get('productPrice', 0)
-            if price > 0:
-                price_tiers.append(f"{qty}+: ${price}")
+        # First three priced tiers for display
+        price_tiers = islice(
+            (f"{tier.get('endAmount', 0)}+: ${price}"
+             for tier in product_data.get('productPriceList', [])
+             if (price := tier.get('productPrice', 0)) > 0),
+            3
+        )
         
-        print(f"{i:2}. {product_code}")
-        print(f"    Stock: {stock:,}")
-        print(f"    Bulk Price: ${bulk_price:.6f}")
-        print(f"    Price Tiers: {' | '.join(price_tiers[:3])}")
+        print(f"{i:2}. {product_code}\n"
+              f"    Stock: {stock:,}\n"
+              f"    Bulk Price: ${bulk_price:.6f}\n"
+              f"    Price Tiers: {' | '.join(price_tiers)}")
         
-        # Verify sorting (bulk price should be ascending)
-        if i > 1 and bulk_price < previous_bulk_price:
-            print(f"    ⚠️  WARNING: Bulk price ${bulk_price:.6f} < previous ${previous_bulk_price:.6f}")
+        if i in out_of_order:
+            print(f"    ⚠️  WARNING: Bulk price ${bulk_price:.6f} < previous ${bulk_prices[i - 2]:.6f}")
         
-        previous_bulk_price = bulk_price
         print()
     
     print(f"Total results: {results['total']}")
     print(f"Current page: {results['current_page']}")
 
-def test_category_bulk_sorting():
+def test_category_bulk_sorting(mock_database):
     """Test bulk sorting in category browsing."""
     print("\nTesting bulk price sorting in all products...")
     
-    db = MockDatabase()
+    db = mock_database
     
     # Test browsing all products (since category_id not supported)
     results = db.search_products("", page=1, page_size=5)
@@ -99,18 +115,20 @@ def test_category_bulk_sorting():
         print("No results found - database might be empty")
         return
     
-    for i, product in enumerate(results['productList'], 1):
+    bulk_prices = [get_bulk_price(product) for product in results['productList']]
+    
+    for i, (product, bulk_price) in enumerate(zip(results['productList'], bulk_prices), 1):
         product_data = product  # Product data is directly in the list item
         product_code = product_data.get('productCode', 'Unknown')
-        bulk_price = get_bulk_price(product_data)
         stock = product_data.get('stockNumber', 0)
         
         print(f"{i}. {product_code} - Bulk: ${bulk_price:.6f} - Stock: {stock:,}")
 
 if __name__ == "__main__":
     try:
-        test_bulk_price_sorting()
-        test_category_bulk_sorting()
+        db = MockDatabase()
+        test_bulk_price_sorting(db)
+        test_category_bulk_sorting(db)
         print("\n✅ Bulk price sorting test completed!")
     except Exception as e:
         print(f"\n❌ Error during testing: {e}")
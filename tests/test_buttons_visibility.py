@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,12 +13,28 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
+def open_stock_browser(root, api_client):
+    """Open the stock browser and print which title bar controls to look for."""
+    browser = StockBrowserWindow(root, api_client, Config())
+    
+    # Add debugging
+    print("=== WINDOW CONTROLS TEST ===")
+    print("✅ Standard Windows title bar controls now enabled!")
+    print("Look in the TOP-RIGHT corner of the window title bar for:")
+    print("  🗕 Minimize button")
+    print("  🗖 Maximize/Restore button") 
+    print("  ❌ Close button")
+    print("")
+    print("Additional features:")
+    print("  F11 = Toggle fullscreen mode")
+    print("  Standard Windows shortcuts work (Alt+F4, etc.)")
+    print("===============================")
+    return browser
+
+
 def main():
     """Test window controls with minimal setup."""
     try:
-        # Create minimal config
-        config = Config()
-        
         # Create mock API client
         api_client = LCSCClient(
             base_url="http://localhost:5000",
@@ -29,22 +47,8 @@ def main():
         root.withdraw()
         
         # Create stock browser
-        browser = StockBrowserWindow(root, api_client, config)
+        open_stock_browser(root, api_client)
         
-        # Add debugging
-        print("=== WINDOW CONTROLS TEST ===")
-        print("✅ Standard Windows title bar controls now enabled!")
-        print("Look in the TOP-RIGHT corner of the window title bar for:")
-        print("  🗕 Minimize button")
-        print("  🗖 Maximize/Restore button") 
-        print("  ❌ Close button")
-        print("")
-        print("Additional features:")
-        print("  F11 = Toggle fullscreen mode")
-        print("  Standard Windows shortcuts work (Alt+F4, etc.)")
-        print("===============================")
-        
-        # Start the event loop
         root.mainloop()
         
     except Exception as e:
@@ -53,5 +57,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_buttons_visibility(tk_root, mock_api_client):
+    """Open the stock browser on the shared test root."""
+    open_stock_browser(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -8,43 +8,62 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from lhatolcsc.api.client import LCSCClient
 import json
 
-# Test category endpoint
-print("="*60)
-print("Testing LCSC Category API")
-print("="*60)
 
-try:
-    # Create API client (will use mock server)
-    client = LCSCClient(
-        api_key="test_api_key_12345",
-        api_secret="test_api_secret_67890",
-        base_url="http://localhost:5000"
-    )
-    
-    # Get categories
-    categories = client.get_categories()
-    
-    print(f"\n✓ Found {len(categories)} top-level categories\n")
-    
-    # Display category tree
+def print_category_tree(categories):
+    """Print top-level categories and their subcategories."""
     for cat in categories:
         print(f"📁 {cat['categoryName']} (ID: {cat['categoryId']})")
-        
+    
         # Show subcategories
         children = cat.get('children', [])
         for child in children:
             print(f"   └─ {child['categoryName']} (ID: {child['categoryId']})")
         print()
+
+
+def test_category_api(lcsc_client):
+    """Fetch the category tree through the API client and check its shape."""
+    print("="*60)
+    print("Testing LCSC Category API")
+    print("="*60)
+
+    # Get categories
+    categories = lcsc_client.get_categories()
+
+    print(f"\n✓ Found {len(categories)} top-level categories\n")
+    assert categories, "No categories returned"
+    for cat in categories:
+        assert cat.get('categoryName')
+        assert 'categoryId' in cat
+        for child in cat.get('children', []):
+            assert child.get('categoryName')
+            assert 'categoryId' in child
+
+    print_category_tree(categories)
+
+
+if __name__ == "__main__":
+    # Create API client (will use mock server)
+    client = LCSCClient(
+        api_key="test_api_key_12345",
+        api_secret="test_api_secret_67890",
+        base_url="http://localhost:5000"
+    )
+
+    try:
+        categories = client.get_categories()
+        print(f"\n✓ Found {len(categories)} top-level categories\n")
+        print_category_tree(categories)
     
-    # Save to file for reference
-    with open('category_tree.json', 'w', encoding='utf-8') as f:
-        json.dump(categories, f, indent=2, ensure_ascii=False)
-    print("💾 Category tree saved to: category_tree.json")
+        # Save to file for reference
+        with open('category_tree.json', 'w', encoding='utf-8') as f:
+            json.dump(categories, f, indent=2, ensure_ascii=False)
+        print("💾 Category tree saved to: category_tree.json")
     
-except ConnectionRefusedError:
-    print("❌ Error: Cannot connect to mock server")
-    print("   Please make sure the server is running on http://localhost:5000")
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    except ConnectionRefusedError:
+        print("❌ Error: Cannot connect to mock server")
+        print("   Please make sure the server is running on http://localhost:5000")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,6 +13,32 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
+def open_narrow_stock_browser(root, api_client):
+    """Open the stock browser in a narrow window and print what to check."""
+    stock_browser = StockBrowserWindow(root, api_client, Config())
+    
+    # Start in a narrow window to force horizontal scrolling
+    stock_browser.window.geometry("600x700+100+100")
+    
+    print("=== COLUMN WIDTH BEHAVIOR TEST ===")
+    print("Stock Browser opened in narrow window to test column behavior.")
+    print("")
+    print("Test Instructions:")
+    print("1. Click 'List All Stock' to load data")
+    print("2. Verify horizontal scrollbar appears")
+    print("3. Resize window to be very narrow")
+    print("4. Check that columns maintain fixed widths")
+    print("5. Try fullscreen (F11) and back - columns should stay fixed")
+    print("")
+    print("Expected behavior:")
+    print("- Columns should NOT compress to fit window")
+    print("- Horizontal scrollbar should always be available")
+    print("- Column widths should remain constant regardless of window size")
+    print("- After fullscreen toggle, columns keep fixed widths")
+    print("=================================")
+    return stock_browser
+
+
 def main():
     """Test column stretching behavior."""
     try:
@@ -19,35 +47,14 @@ def main():
         root.title("Column Width Test")
         root.geometry("400x300+100+100")
         
-        # Create stock browser
-        config = Config()
+        # Create mock API client
         api_client = LCSCClient(
             base_url="http://localhost:5000",
             api_key="test",
             api_secret="test"
         )
         
-        stock_browser = StockBrowserWindow(root, api_client, config)
-        
-        # Start in a narrow window to force horizontal scrolling
-        stock_browser.window.geometry("600x700+100+100")
-        
-        print("=== COLUMN WIDTH BEHAVIOR TEST ===")
-        print("Stock Browser opened in narrow window to test column behavior.")
-        print("")
-        print("Test Instructions:")
-        print("1. Click 'List All Stock' to load data")
-        print("2. Verify horizontal scrollbar appears")
-        print("3. Resize window to be very narrow")
-        print("4. Check that columns maintain fixed widths")
-        print("5. Try fullscreen (F11) and back - columns should stay fixed")
-        print("")
-        print("Expected behavior:")
-        print("- Columns should NOT compress to fit window")
-        print("- Horizontal scrollbar should always be available")
-        print("- Column widths should remain constant regardless of window size")
-        print("- After fullscreen toggle, columns keep fixed widths")
-        print("=================================")
+        open_narrow_stock_browser(root, api_client)
         
         root.mainloop()
         
@@ -57,5 +64,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_column_widths(tk_root, mock_api_client):
+    """Open the narrow stock browser window on the shared test root."""
+    open_narrow_stock_browser(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
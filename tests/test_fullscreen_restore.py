@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,6 +13,31 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
+def open_left_half_stock_browser(root, api_client):
+    """Open the stock browser on the left half of the screen and print what to check."""
+    stock_browser = StockBrowserWindow(root, api_client, Config())
+    
+    # Position for testing - simulate dragging to left side
+    stock_browser.window.geometry("960x1040+0+0")  # Left half of 1920x1080 screen
+    
+    print("=== FULLSCREEN GEOMETRY TEST ===")
+    print("Stock Browser positioned as if dragged to left side of screen.")
+    print("")
+    print("Test Instructions:")
+    print("1. Note the current window position and size")
+    print("2. Press F11 to enter fullscreen mode")
+    print("3. Press F11 again to exit fullscreen mode")
+    print("4. Verify window returns to EXACT same position and size")
+    print("")
+    print("Expected behavior:")
+    print("- Window should return to left-side split screen position")
+    print("- Size should be exactly the same as before fullscreen")
+    print("- No compression or distortion should occur")
+    print("- Position should be preserved (left edge of screen)")
+    print("==============================")
+    return stock_browser
+
+
 def main():
     """Test fullscreen geometry restoration."""
     try:
@@ -19,34 +46,14 @@ def main():
         root.title("Fullscreen Test")
         root.geometry("300x200+100+100")
         
-        # Create stock browser
-        config = Config()
+        # Create mock API client
         api_client = LCSCClient(
             base_url="http://localhost:5000",
             api_key="test",
             api_secret="test"
         )
         
-        stock_browser = StockBrowserWindow(root, api_client, config)
-        
-        # Position for testing - simulate dragging to left side
-        stock_browser.window.geometry("960x1040+0+0")  # Left half of 1920x1080 screen
-        
-        print("=== FULLSCREEN GEOMETRY TEST ===")
-        print("Stock Browser positioned as if dragged to left side of screen.")
-        print("")
-        print("Test Instructions:")
-        print("1. Note the current window position and size")
-        print("2. Press F11 to enter fullscreen mode")
-        print("3. Press F11 again to exit fullscreen mode")
-        print("4. Verify window returns to EXACT same position and size")
-        print("")
-        print("Expected behavior:")
-        print("- Window should return to left-side split screen position")
-        print("- Size should be exactly the same as before fullscreen")
-        print("- No compression or distortion should occur")
-        print("- Position should be preserved (left edge of screen)")
-        print("==============================")
+        open_left_half_stock_browser(root, api_client)
         
         root.mainloop()
         
@@ -56,5 +63,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_fullscreen_restore(tk_root, mock_api_client):
+    """Open the stock browser for the fullscreen check on the shared test root."""
+    open_left_half_stock_browser(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
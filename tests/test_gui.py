@@ -2,17 +2,24 @@
 import tkinter as tk
 from tkinter import messagebox
 
+import pytest
+
+def build_test_window(root):
+    """Add the test label and button to root."""
+    label = tk.Label(root, text="If you see this, the GUI is working!", font=("Arial", 14))
+    label.pack(pady=50)
+    
+    button = tk.Button(root, text="Click Me", command=lambda: messagebox.showinfo("Test", "Button works!"))
+    button.pack()
+
+
 def main():
     try:
         root = tk.Tk()
         root.title("LHAtoLCSC Test")
         root.geometry("400x200")
         
-        label = tk.Label(root, text="If you see this, the GUI is working!", font=("Arial", 14))
-        label.pack(pady=50)
-        
-        button = tk.Button(root, text="Click Me", command=lambda: messagebox.showinfo("Test", "Button works!"))
-        button.pack()
+        build_test_window(root)
         
         root.mainloop()
         print("GUI closed normally")
@@ -22,5 +29,12 @@ def main():
         traceback.print_exc()
         input("Press Enter to exit...")
 
+@pytest.mark.gui
+def test_gui(tk_root):
+    """Build the basic test window on the shared test root."""
+    build_test_window(tk_root)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
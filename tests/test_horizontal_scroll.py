@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,6 +13,31 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
+def open_small_stock_browser(root, api_client):
+    """Open the stock browser in a smaller window and print what to check."""
+    stock_browser = StockBrowserWindow(root, api_client, Config())
+    
+    # Position browser to test split screen - smaller window
+    stock_browser.window.geometry("800x600+500+50")
+    
+    print("=== HORIZONTAL SCROLLING TEST ===")
+    print("Stock Browser should now be open in a smaller window.")
+    print("")
+    print("Test Instructions:")
+    print("1. Click 'List All Stock' to load products")
+    print("2. Try to drag the window to half-screen (Win+Left)")
+    print("3. Check that horizontal scrollbar appears")
+    print("4. Test horizontal scrolling with mouse wheel or drag")
+    print("5. Verify all columns are accessible")
+    print("")
+    print("Expected behavior:")
+    print("- Window should resize properly to half-screen")
+    print("- Horizontal scrollbar should be functional")
+    print("- All price columns should be accessible via scrolling")
+    print("================================")
+    return stock_browser
+
+
 def main():
     """Test horizontal scrolling functionality."""
     try:
@@ -23,34 +50,14 @@ def main():
         tk.Label(root, text="Main Window\nfor split screen test", 
                 justify=tk.CENTER, pady=100).pack()
         
-        # Create stock browser positioned for testing
-        config = Config()
+        # Create mock API client
         api_client = LCSCClient(
             base_url="http://localhost:5000",
             api_key="test",
             api_secret="test"
         )
         
-        stock_browser = StockBrowserWindow(root, api_client, config)
-        
-        # Position browser to test split screen - smaller window
-        stock_browser.window.geometry("800x600+500+50")
-        
-        print("=== HORIZONTAL SCROLLING TEST ===")
-        print("Stock Browser should now be open in a smaller window.")
-        print("")
-        print("Test Instructions:")
-        print("1. Click 'List All Stock' to load products")
-        print("2. Try to drag the window to half-screen (Win+Left)")
-        print("3. Check that horizontal scrollbar appears")
-        print("4. Test horizontal scrolling with mouse wheel or drag")
-        print("5. Verify all columns are accessible")
-        print("")
-        print("Expected behavior:")
-        print("- Window should resize properly to half-screen")
-        print("- Horizontal scrollbar should be functional")
-        print("- All price columns should be accessible via scrolling")
-        print("================================")
+        open_small_stock_browser(root, api_client)
         
         root.mainloop()
         
@@ -60,5 +67,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_horizontal_scroll(tk_root, mock_api_client):
+    """Open the stock browser for the scrolling check on the shared test root."""
+    open_small_stock_browser(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,6 @@
 """Test if component images are accessible."""
 import requests
 from PIL import Image
-from io import BytesIO
 
 # Test resistor image URL
 url = "https://wmsc.lcsc.com/szlcsc/2304140030_UNI-ROYAL-Uniroyal-Elec-0402WGF1000TCE_C25744.jpg"
@@ -17,18 +16,42 @@ headers = {
     'Accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
 }
 
+
+class CountingReader:
+    """Read-only wrapper around a stream that counts the bytes read from it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+
+    def read(self, *args):
+        data = self.stream.read(*args)
+        self.bytes_read += len(data)
+        return data
+
+
+# Reuse one connection for every image URL tested
+session = requests.Session()
+session.headers.update(headers)
+
 try:
     print("Downloading image with proper headers...")
-    response = requests.get(url, timeout=5, headers=headers)
+    response = session.get(url, timeout=5, stream=True)
     response.raise_for_status()
     
     print(f"✓ Status: {response.status_code}")
     print(f"✓ Content-Type: {response.headers.get('Content-Type')}")
-    print(f"✓ Size: {len(response.content):,} bytes")
     
-    # Try to open as image
+    # Try to open as image, decoding straight from the response stream; the
+    # size is what PIL actually read (Content-Length is missing for chunked
+    # responses and is the compressed size for encoded ones)
     print("\nOpening image with PIL...")
-    img = Image.open(BytesIO(response.content))
+    response.raw.decode_content = True
+    with response:
+        body = CountingReader(response.raw)
+        img = Image.open(body)
+        img.load()
+    print(f"✓ Downloaded: {body.bytes_read:,} bytes")
     print(f"✓ Format: {img.format}")
     print(f"✓ Size: {img.size}")
     print(f"✓ Mode: {img.mode}")
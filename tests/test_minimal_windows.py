@@ -3,13 +3,11 @@
 
 import tkinter as tk
 
+import pytest
 
-def main():
-    """Create minimal windows to test title bar controls."""
-    root = tk.Tk()
-    root.title("Root Window")
-    root.geometry("300x200")
-    
+
+def open_minimal_windows(root):
+    """Open the three title bar test windows on root."""
     # Test 1: Basic Toplevel
     window1 = tk.Toplevel(root)
     window1.title("Test 1: Basic Toplevel - Check for Min/Max/Close")
@@ -50,9 +48,25 @@ def main():
     print("")
     print("This will help identify which setting removes the title bar buttons.")
     print("============================")
+
+
+def main():
+    """Create minimal windows to test title bar controls."""
+    root = tk.Tk()
+    root.title("Root Window")
+    root.geometry("300x200")
+    
+    open_minimal_windows(root)
     
     root.mainloop()
 
 
+@pytest.mark.gui
+def test_minimal_windows(tk_root):
+    """Open the three title bar test windows on the shared Tk root."""
+    open_minimal_windows(tk_root)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
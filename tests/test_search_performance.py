@@ -4,19 +4,18 @@ Test search performance with SQLite database
 import requests
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 BASE_URL = "http://localhost:5000"
 
-def test_search(query, description):
-    """Test search and measure time"""
-    print(f"\n{'='*60}")
-    print(f"Testing: {description}")
-    print(f"Query: {query}")
-    print(f"{'='*60}")
-    
+# Client processes used for the throughput test, each running every query
+THROUGHPUT_WORKERS = 8
+
+def run_search(session, query):
+    """Run one search and return (elapsed seconds, response)"""
     start = time.time()
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/rest/wmsc2agent/search/product",
         json={
             "searchContent": query,
@@ -25,7 +24,21 @@ def test_search(query, description):
         }
     )
     
-    elapsed = time.time() - start
+    return time.time() - start, response
+
+def run_query_batch(queries):
+    """Run the queries one after another in a fresh session; return the request count"""
+    with requests.Session() as session:
+        for query in queries:
+            run_search(session, query)
+    return len(queries)
+
+def report_search(query, description, elapsed, response):
+    """Print the results and timing of one search"""
+    print(f"\n{'='*60}")
+    print(f"Testing: {description}")
+    print(f"Query: {query}")
+    print(f"{'='*60}")
     
     if response.status_code == 200:
         data = response.json()
@@ -47,8 +60,6 @@ def test_search(query, description):
             print(f"❌ API Error: {data.get('message')}")
     else:
         print(f"❌ HTTP Error {response.status_code}")
-    
-    return elapsed
 
 if __name__ == '__main__':
     print("\n" + "="*60)
@@ -64,11 +75,17 @@ if __name__ == '__main__':
         ("led", "LED search"),
     ]
     
+    # The searches are independent, so run them all at once and report
+    # them afterwards
+    wall_start = time.time()
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        searches = list(executor.map(lambda test: run_search(session, test[0]), tests))
+    wall_clock = time.time() - wall_start
+    
     times = []
-    for query, desc in tests:
-        elapsed = test_search(query, desc)
+    for (query, desc), (elapsed, response) in zip(tests, searches):
+        report_search(query, desc, elapsed, response)
         times.append(elapsed)
-        time.sleep(0.5)  # Small delay between tests
     
     print("\n" + "="*60)
     print("Performance Summary")
@@ -76,5 +93,16 @@ if __name__ == '__main__':
     print(f"Average search time: {sum(times)/len(times):.3f} seconds")
     print(f"Fastest search: {min(times):.3f} seconds")
     print(f"Slowest search: {max(times):.3f} seconds")
+    print(f"Total wall-clock time: {wall_clock:.3f} seconds ({len(tests)} concurrent searches)")
+    
+    # Throughput: independent client processes, each running all queries,
+    # so the server's own concurrency is what limits the result
+    queries = [query for query, _ in tests]
+    wall_start = time.time()
+    with ProcessPoolExecutor(max_workers=THROUGHPUT_WORKERS) as executor:
+        total_requests = sum(executor.map(run_query_batch, [queries] * THROUGHPUT_WORKERS))
+    wall_clock = time.time() - wall_start
+    print(f"Throughput: {total_requests / wall_clock:.1f} requests/second "
+          f"({total_requests} requests from {THROUGHPUT_WORKERS} processes in {wall_clock:.3f} seconds)")
     print("\nCompare this to previous JSON-based search (5-30 seconds)!")
     print("="*60)
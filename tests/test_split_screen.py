@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,6 +13,56 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
+def open_split_screen_windows(root, api_client):
+    """Fill root, open the right-hand test window and the stock browser."""
+    # Add some scrollable content to main window
+    main_frame = tk.Frame(root)
+    main_frame.pack(fill=tk.BOTH, expand=True)
+
+    main_scroll = tk.Scrollbar(main_frame)
+    main_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+    main_listbox = tk.Listbox(main_frame, yscrollcommand=main_scroll.set)
+    main_listbox.insert(tk.END, *(f"Main window item {i+1}" for i in range(100)))
+    main_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    main_scroll.config(command=main_listbox.yview)
+
+    # Create a test window on the right
+    test_window = tk.Toplevel(root)
+    test_window.title("Test Window (Right Side)")
+    test_window.geometry("500x600+650+100")
+
+    # Add scrollable content to test window
+    test_frame = tk.Frame(test_window)
+    test_frame.pack(fill=tk.BOTH, expand=True)
+
+    test_scroll = tk.Scrollbar(test_frame)
+    test_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+    test_listbox = tk.Listbox(test_frame, yscrollcommand=test_scroll.set)
+    test_listbox.insert(tk.END, *(f"Right window item {i+1}" for i in range(100)))
+    test_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    test_scroll.config(command=test_listbox.yview)
+
+    # Create stock browser
+    stock_browser = StockBrowserWindow(root, api_client, Config())
+    # Position stock browser on the left
+    stock_browser.window.geometry("800x700+50+50")
+
+    print("=== SPLIT SCREEN TEST ===")
+    print("Three windows should be open:")
+    print("1. Main Window (Left) - with scrollable list")
+    print("2. Test Window (Right) - with scrollable list") 
+    print("3. Stock Browser - should work in split screen")
+    print("")
+    print("Test Instructions:")
+    print("1. Drag Stock Browser to left side of screen")
+    print("2. Position Test Window on right side")
+    print("3. Click in Test Window to focus it")
+    print("4. Try scrolling in Stock Browser - should still work!")
+    print("========================")
+
+
 def main():
     """Test split screen behavior."""
     try:
@@ -19,61 +71,13 @@ def main():
         root.title("Main Window (Left Side)")
         root.geometry("500x600+100+100")
         
-        # Add some scrollable content to main window
-        main_frame = tk.Frame(root)
-        main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        main_scroll = tk.Scrollbar(main_frame)
-        main_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        main_listbox = tk.Listbox(main_frame, yscrollcommand=main_scroll.set)
-        for i in range(100):
-            main_listbox.insert(tk.END, f"Main window item {i+1}")
-        main_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        main_scroll.config(command=main_listbox.yview)
-        
-        # Create a test window on the right
-        test_window = tk.Toplevel(root)
-        test_window.title("Test Window (Right Side)")
-        test_window.geometry("500x600+650+100")
-        
-        # Add scrollable content to test window
-        test_frame = tk.Frame(test_window)
-        test_frame.pack(fill=tk.BOTH, expand=True)
-        
-        test_scroll = tk.Scrollbar(test_frame)
-        test_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        test_listbox = tk.Listbox(test_frame, yscrollcommand=test_scroll.set)
-        for i in range(100):
-            test_listbox.insert(tk.END, f"Right window item {i+1}")
-        test_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        test_scroll.config(command=test_listbox.yview)
-        
-        # Create stock browser
-        config = Config()
         api_client = LCSCClient(
             base_url="http://localhost:5000",
             api_key="test",
             api_secret="test"
         )
         
-        stock_browser = StockBrowserWindow(root, api_client, config)
-        # Position stock browser on the left
-        stock_browser.window.geometry("800x700+50+50")
-        
-        print("=== SPLIT SCREEN TEST ===")
-        print("Three windows should be open:")
-        print("1. Main Window (Left) - with scrollable list")
-        print("2. Test Window (Right) - with scrollable list") 
-        print("3. Stock Browser - should work in split screen")
-        print("")
-        print("Test Instructions:")
-        print("1. Drag Stock Browser to left side of screen")
-        print("2. Position Test Window on right side")
-        print("3. Click in Test Window to focus it")
-        print("4. Try scrolling in Stock Browser - should still work!")
-        print("========================")
+        open_split_screen_windows(root, api_client)
         
         root.mainloop()
         
@@ -83,5 +87,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_split_screen(tk_root, mock_api_client):
+    """Open the split screen windows on the shared test root."""
+    open_split_screen_windows(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,9 +7,11 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from lhatolcsc.gui.currency_converter import currency_converter
 import re
 
+# Mirrors the price pattern in lhatolcsc.gui.stock_browser
+_PRICE_STRIP_RE = re.compile(r'[^\d.-]')
+
 
 def test_price_extraction():
     """Test the price extraction logic used in sorting."""
@@ -19,7 +21,7 @@ def test_price_extraction():
             return None
         try:
             # Remove currency symbols except decimal point
-            numeric_str = re.sub(r'[^\d.-]', '', val)
+            numeric_str = _PRICE_STRIP_RE.sub('', val)
             if numeric_str:
                 return float(numeric_str)
             return None
@@ -74,6 +76,10 @@ def test_price_extraction():
 
 def test_currency_symbols():
     """Test currency symbol display in headers."""
+    # Imported here so test_price_extraction does not load the converter
+    # (and requests) it never uses
+    from lhatolcsc.gui.currency_converter import currency_converter
+    
     print("\n💱 Testing Currency Header Symbols")
     print("=" * 50)
     
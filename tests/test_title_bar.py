@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,8 +13,8 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
-def test_simple_window():
-    """Test a simple toplevel window to compare."""
+def create_simple_window():
+    """Create a simple toplevel window to compare."""
     simple = tk.Toplevel()
     simple.title("Simple Test Window - Should have Min/Max/Close")
     simple.geometry("400x300")
@@ -24,18 +26,32 @@ def test_simple_window():
     return simple
 
 
+def open_test_windows(root, api_client):
+    """Open the simple window and the stock browser, and print what to compare."""
+    # Create the simple test window once the event loop is running, so
+    # the stock browser setup is not held up by it
+    root.after_idle(create_simple_window)
+    
+    # Create stock browser
+    StockBrowserWindow(root, api_client, Config())
+    
+    print("=== TITLE BAR CONTROLS TEST ===")
+    print("Two windows should now be open:")
+    print("1. 'Simple Test Window' - Should have Min/Max/Close buttons")
+    print("2. 'Stock Browser' - Should also have Min/Max/Close buttons")
+    print("")
+    print("If the Stock Browser is missing buttons but Simple Window has them,")
+    print("then we know the issue is in the Stock Browser configuration.")
+    print("===============================")
+
+
 def main():
     """Test window controls."""
     try:
         root = tk.Tk()
         root.title("Root Window")
         root.geometry("300x200")
-        
-        # Create simple test window first
-        simple_window = test_simple_window()
-        
-        # Create minimal config
-        config = Config()
+        root.withdraw()  # Only the two windows below are compared
         
         # Create mock API client
         api_client = LCSCClient(
@@ -44,17 +60,7 @@ def main():
             api_secret="test"
         )
         
-        # Create stock browser
-        StockBrowserWindow(root, api_client, config)
-        
-        print("=== TITLE BAR CONTROLS TEST ===")
-        print("Two windows should now be open:")
-        print("1. 'Simple Test Window' - Should have Min/Max/Close buttons")
-        print("2. 'Stock Browser' - Should also have Min/Max/Close buttons")
-        print("")
-        print("If the Stock Browser is missing buttons but Simple Window has them,")
-        print("then we know the issue is in the Stock Browser configuration.")
-        print("===============================")
+        open_test_windows(root, api_client)
         
         root.mainloop()
         
@@ -64,5 +70,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_title_bar(tk_root, mock_api_client):
+    """Open both title bar test windows on the shared test root."""
+    open_test_windows(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,6 +4,8 @@
 import sys
 import tkinter as tk
 
+import pytest
+
 sys.path.insert(0, 'src')
 
 from lhatolcsc.gui.stock_browser import StockBrowserWindow
@@ -11,12 +13,21 @@ from lhatolcsc.api.client import LCSCClient
 from lhatolcsc.core.config import Config
 
 
+def open_stock_browser(root, api_client):
+    """Open the stock browser on root and print what to check."""
+    # Create the stock browser window
+    StockBrowserWindow(root, api_client, Config())
+    
+    print("Stock Browser Window opened successfully!")
+    print("Test the following features:")
+    print("1. Click the 'Minimize' button or press Ctrl+M")
+    print("2. Click the 'Fullscreen' button or press F11/Alt+Return")
+    print("3. Close the window to exit")
+
+
 def main():
     """Test the stock browser window controls."""
     try:
-        # Create a minimal config
-        config = Config()
-        
         # Create a mock API client
         api_client = LCSCClient(
             base_url="http://localhost:5000",
@@ -28,14 +39,7 @@ def main():
         root = tk.Tk()
         root.withdraw()  # Hide the root window
         
-        # Create the stock browser window
-        StockBrowserWindow(root, api_client, config)
-        
-        print("Stock Browser Window opened successfully!")
-        print("Test the following features:")
-        print("1. Click the 'Minimize' button or press Ctrl+M")
-        print("2. Click the 'Fullscreen' button or press F11/Alt+Return")
-        print("3. Close the window to exit")
+        open_stock_browser(root, api_client)
         
         # Start the GUI event loop
         root.mainloop()
@@ -46,5 +50,12 @@ def main():
         traceback.print_exc()
 
 
+@pytest.mark.gui
+def test_window_controls(tk_root, mock_api_client):
+    """Open the stock browser on the shared test root."""
+    open_stock_browser(tk_root, mock_api_client)
+    tk_root.update()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
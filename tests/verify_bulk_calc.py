@@ -32,13 +32,17 @@ def verify_bulk_price_calculation():
     highest_qty = 0
     best_bulk_price = float('inf')
     
-    for i, tier in enumerate(price_list, 1):
-        start_qty = tier.get('startAmount', 0)
+    # Print all tiers in one write
+    if price_list:
+        print("\n".join(
+            f"  {i}. Qty {tier.get('startAmount', 0)}-{tier.get('endAmount', 0)}: ${tier.get('productPrice', 0)}"
+            for i, tier in enumerate(price_list, 1)
+        ))
+    
+    for tier in price_list:
         end_qty = tier.get('endAmount', 0)
         price = tier.get('productPrice', 0)
         
-        print(f"  {i}. Qty {start_qty}-{end_qty}: ${price}")
-        
         # Find highest quantity with valid price
         if price > 0 and end_qty >= highest_qty:
             if end_qty > highest_qty or price < best_bulk_price:
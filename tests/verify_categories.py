@@ -1,33 +1,27 @@
 """Quick check to verify category assignments."""
 import sqlite3
 
-conn = sqlite3.connect('mock_products.db')
+# Read-only, memory-mapped: this script only samples rows, and should not
+# create an empty database if mock_products.db is missing
+conn = sqlite3.connect('file:mock_products.db?mode=ro', uri=True)
+conn.execute('PRAGMA mmap_size=268435456')
 cursor = conn.cursor()
 
-# Check any resistors with categories
-cursor.execute('''
-    SELECT product_code, product_model, package_type, parent_catalog_name 
-    FROM products 
-    WHERE parent_catalog_name LIKE '%Resistor%'
-    LIMIT 10
-''')
+# Check any resistors and capacitors with categories; LIMIT stops each
+# scan at the first 10 matches
+for i, category in enumerate(('Resistor', 'Capacitor')):
+    if i:
+        print()
 
-print("Sample Resistors with categories:")
-for row in cursor.fetchall():
-    print(f"  {row[0]} - {row[1]} ({row[2]}): {row[3]}")
+    cursor.execute('''
+        SELECT product_code, product_model, package_type, parent_catalog_name
+        FROM products
+        WHERE parent_catalog_name LIKE ?
+        LIMIT 10
+    ''', (f'%{category}%',))
 
-print()
-
-# Check any capacitors
-cursor.execute('''
-    SELECT product_code, product_model, package_type, parent_catalog_name 
-    FROM products 
-    WHERE parent_catalog_name LIKE '%Capacitor%'
-    LIMIT 10
-''')
-
-print("Sample Capacitors with categories:")
-for row in cursor.fetchall():
-    print(f"  {row[0]} - {row[1]} ({row[2]}): {row[3]}")
+    print(f"Sample {category}s with categories:")
+    for row in cursor.fetchall():
+        print(f"  {row[0]} - {row[1]} ({row[2]}): {row[3]}")
 
 conn.close()
@@ -21,16 +21,60 @@ Requirements:
 """
 
 import argparse
+import atexit
+import os
 import re
 import subprocess
 import sys
 import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Optional
 
 from git import Repo
-from github import Github
+from github import Github, UnknownObjectException
+
+# Version patterns in the files update_version_files rewrites. pyproject.toml is
+# anchored to the start of a line so python_version, minversion and py-version
+# in the tool sections are left alone
+_CONFIG_VERSION_RE = re.compile(r'(self\.version\s*=\s*["\'])([^"\']+)(["\'])')
+_PYPROJECT_VERSION_RE = re.compile(r'(^version\s*=\s*["\'])([^"\']+)(["\'])', re.MULTILINE)
+_SETUP_VERSION_RE = re.compile(r'(version\s*=\s*["\'])([^"\']+)(["\'])')
+_CONFIG_VERSION_READ_RE = re.compile(r'self\.version\s*=\s*["\']([^"\']+)["\']')
+_VERSION_FILE_PATTERNS = {
+    "config.py": _CONFIG_VERSION_RE,
+    "pyproject.toml": _PYPROJECT_VERSION_RE,
+    "setup.py": _SETUP_VERSION_RE,
+}
+
+# Commit subject keywords for release note sections, matched anywhere in the
+# lowercased subject; a feature keyword wins over a fix keyword
+_FEATURE_COMMIT_RE = re.compile(r'feat:|feature:|add:|new:')
+_FIX_COMMIT_RE = re.compile(r'fix:|bug:|hotfix:|patch:')
+
+# Release note sections in display order: (key, heading)
+RELEASE_NOTE_SECTIONS = (
+    ("features", "### ✨ Features"),
+    ("fixes", "### 🐛 Bug Fixes"),
+    ("other", "### 📝 Other Changes"),
+)
+
+# Workflow status polling: first wait, doubled after each check up to the max (seconds)
+WORKFLOW_POLL_INITIAL_DELAY = 5
+WORKFLOW_POLL_MAX_DELAY = 60
+
+# Old release asset cleanup: the newest releases left untouched, and how many
+# releases after them are checked by default (--max-clean-releases)
+KEEP_RELEASE_ASSETS = 3
+DEFAULT_MAX_CLEAN_RELEASES = 10
+
+# Minimum remaining GitHub API requests to start a release with; a full run
+# with workflow polling and asset cleanup uses a few dozen
+MIN_API_QUOTA = 100
+
+# Marks a cached value that has not been fetched yet (None is a valid result)
+_UNSET = object()
 
 
 class Colors:
@@ -53,6 +97,15 @@ class ReleaseLogger:
         self.log_file = Path(log_file)
         self.log_file.parent.mkdir(exist_ok=True)
 
+        # One line-buffered handle for the whole run instead of reopening
+        # the file for every entry; each line still reaches the file at once
+        self._file = open(self.log_file, "a", encoding="utf-8", buffering=1)
+        atexit.register(self.close)
+
+    def close(self):
+        """Close the log file."""
+        self._file.close()
+
     def _log(self, level: str, message: str, color: str = ""):
         """Internal logging method."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -62,8 +115,7 @@ class ReleaseLogger:
         print(f"{color}{log_entry}{Colors.ENDC}")
 
         # Write to file without color codes
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"{log_entry}\n")
+        self._file.write(f"{log_entry}\n")
 
     def header(self, text: str):
         """Print formatted header."""
@@ -153,7 +205,9 @@ class GitHubReleaseMaster:
 
         # GitHub setup
         self.github_token = github_token or self._get_github_token()
-        self.github = Github(self.github_token)
+        # PyGithub retries 5xx errors and waits out secondary rate limits by
+        # default (GithubRetry); 100 items per page cuts paginated round trips
+        self.github = Github(self.github_token, per_page=100)
         self.repo_name = self._get_repo_name()
         self.gh_repo = self.github.get_repo(self.repo_name)
 
@@ -166,26 +220,20 @@ class GitHubReleaseMaster:
 
         # State tracking
         self.rollback_info = {}
+        self._latest_release_cache = _UNSET
 
     def _get_github_token(self) -> str:
         """Get GitHub token from environment or git config."""
-        import os
-
         # Try environment variable first
         token = os.getenv("GITHUB_TOKEN")
         if token:
             return token
 
-        # Try git config
+        # Try git config (all levels, like `git config --get github.token`)
         try:
-            result = subprocess.run(
-                ["git", "config", "--get", "github.token"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+            token = str(self.git_repo.config_reader().get_value("github", "token")).strip()
+            if token:
+                return token
         except Exception:
             pass
 
@@ -225,19 +273,63 @@ class GitHubReleaseMaster:
         except Exception as e:
             raise ValueError(f"Failed to determine repository name: {e}")
 
-    def get_latest_release_version(self) -> Optional[Version]:
-        """Get the latest release version from GitHub."""
+    def _is_dirty(self, untracked_files: bool = False) -> bool:
+        """Check for uncommitted changes with a single `git status --porcelain`.
+
+        Repo.is_dirty runs one `git diff` for the index and one for the
+        working tree, plus a status call when untracked files count.
+        """
+        status = self.git_repo.git.status(
+            porcelain=True, untracked_files="normal" if untracked_files else "no"
+        )
+        return bool(status.strip())
+
+    def _has_api_quota(self) -> bool:
+        """Check that enough GitHub API quota is left to finish a release."""
         try:
-            releases = list(self.gh_repo.get_releases())
-            if not releases:
-                self.logger.info("No existing releases found")
-                return None
+            # /rate_limit itself does not count against the quota
+            rate_limit = self.github.get_rate_limit()
+            # Newer PyGithub versions nest the per-resource limits under .resources
+            core = getattr(rate_limit, "resources", rate_limit).core
+        except Exception as e:
+            self.logger.warning(f"Failed to check GitHub API quota: {e}")
+            return True
 
-            latest_release = releases[0]
+        if core.remaining < MIN_API_QUOTA:
+            self.logger.error(
+                f"Only {core.remaining} GitHub API requests left (need {MIN_API_QUOTA}), "
+                f"quota resets at {core.reset}"
+            )
+            return False
+
+        return True
+
+    def _log_rate_limit(self):
+        """Log the remaining GitHub API quota (from the last response's headers)."""
+        try:
+            remaining, limit = self.github.rate_limiting
+            self.logger.info(f"GitHub API quota: {remaining}/{limit} requests remaining")
+        except Exception as e:
+            self.logger.warning(f"Failed to read GitHub API quota: {e}")
+
+    def get_latest_release_version(self) -> Optional[Version]:
+        """Get the latest release version from GitHub (fetched once per run)."""
+        if self._latest_release_cache is _UNSET:
+            self._latest_release_cache = self._fetch_latest_release_version()
+        return self._latest_release_cache
+
+    def _fetch_latest_release_version(self) -> Optional[Version]:
+        """Query GitHub for the latest release version."""
+        try:
+            # /releases/latest is one request; listing releases pages through all of them
+            latest_release = self.gh_repo.get_latest_release()
             version_str = latest_release.tag_name.lstrip('v')
             self.logger.info(f"Latest release: {latest_release.tag_name}")
             return Version(version_str)
 
+        except UnknownObjectException:
+            self.logger.info("No existing releases found")
+            return None
         except Exception as e:
             self.logger.warning(f"Failed to get latest release: {e}")
             return None
@@ -250,7 +342,7 @@ class GitHubReleaseMaster:
             raise FileNotFoundError(f"Config file not found: {config_file}")
 
         content = config_file.read_text(encoding='utf-8')
-        match = re.search(r'self\.version\s*=\s*["\']([^"\']+)["\']', content)
+        match = _CONFIG_VERSION_READ_RE.search(content)
 
         if not match:
             raise ValueError("Version not found in config.py")
@@ -277,47 +369,30 @@ class GitHubReleaseMaster:
         """Update version in all relevant files."""
         self.logger.step(f"Updating version to {new_version}")
         changes = {}
+        replacement = f'\\g<1>{new_version}\\g<3>'
 
         for file_key, file_path in self.version_files.items():
-            if not file_path.exists():
+            try:
+                original_content = file_path.read_text(encoding='utf-8')
+            except FileNotFoundError:
                 self.logger.warning(f"File not found: {file_path}")
                 continue
 
             try:
-                original_content = file_path.read_text(encoding='utf-8')
-                updated_content = original_content
-
-                if file_key == "config.py":
-                    # Update config.py version
-                    updated_content = re.sub(
-                        r'(self\.version\s*=\s*["\'])([^"\']+)(["\'])',
-                        f'\\g<1>{new_version}\\g<3>',
-                        updated_content
-                    )
-
-                elif file_key == "pyproject.toml":
-                    # Update pyproject.toml version
-                    updated_content = re.sub(
-                        r'(version\s*=\s*["\'])([^"\']+)(["\'])',
-                        f'\\g<1>{new_version}\\g<3>',
-                        updated_content
-                    )
-
-                elif file_key == "setup.py":
-                    # Update setup.py version
-                    updated_content = re.sub(
-                        r'(version\s*=\s*["\'])([^"\']+)(["\'])',
-                        f'\\g<1>{new_version}\\g<3>',
-                        updated_content
-                    )
-
-                if updated_content != original_content:
+                # Replace the first version assignment; subn reports whether there was one
+                updated_content, count = _VERSION_FILE_PATTERNS[file_key].subn(
+                    replacement, original_content, count=1
+                )
+
+                if count == 0:
+                    self.logger.warning(f"No version pattern found in {file_path.name}")
+                elif updated_content == original_content:
+                    self.logger.info(f"{file_path.name} is already at {new_version}")
+                else:
                     changes[str(file_path)] = original_content
                     if not dry_run:
                         file_path.write_text(updated_content, encoding='utf-8')
                     self.logger.success(f"Updated {file_path.name}")
-                else:
-                    self.logger.warning(f"No version pattern found in {file_path.name}")
 
             except Exception as e:
                 self.logger.error(f"Failed to update {file_path}: {e}")
@@ -336,25 +411,14 @@ class GitHubReleaseMaster:
                 # Get all commits if no previous tag
                 commit_range = "HEAD"
 
-            # Get git log
-            result = subprocess.run([
-                "git", "log", commit_range,
-                "--pretty=format:• %s",
-                "--no-merges"
-            ], capture_output=True, text=True, cwd=self.repo_path)
-
-            if result.returncode != 0:
-                raise subprocess.CalledProcessError(result.returncode, result.args, result.stderr)
-
-            commits = result.stdout.strip()
+            # Get git log (raises GitCommandError on failure)
+            commits = self.git_repo.git.log(commit_range, pretty="format:• %s", no_merges=True).strip()
 
             if not commits:
                 return "• Initial release"
 
             # Process commits into categories
-            features = []
-            fixes = []
-            other = []
+            sections = {key: [] for key, _ in RELEASE_NOTE_SECTIONS}
 
             for line in commits.split('\n'):
                 line = line.strip()
@@ -362,32 +426,19 @@ class GitHubReleaseMaster:
                     continue
 
                 lower_line = line.lower()
-                if any(keyword in lower_line for keyword in ['feat:', 'feature:', 'add:', 'new:']):
-                    features.append(line)
-                elif any(keyword in lower_line for keyword in ['fix:', 'bug:', 'hotfix:', 'patch:']):
-                    fixes.append(line)
+                if _FEATURE_COMMIT_RE.search(lower_line):
+                    sections["features"].append(line)
+                elif _FIX_COMMIT_RE.search(lower_line):
+                    sections["fixes"].append(line)
                 else:
-                    other.append(line)
-
-            # Build release notes
-            notes = []
+                    sections["other"].append(line)
 
-            if features:
-                notes.append("### ✨ Features")
-                notes.extend(features)
-                notes.append("")
-
-            if fixes:
-                notes.append("### 🐛 Bug Fixes")
-                notes.extend(fixes)
-                notes.append("")
-
-            if other:
-                notes.append("### 📝 Other Changes")
-                notes.extend(other)
-                notes.append("")
-
-            release_notes = '\n'.join(notes).strip()
+            # Build release notes: non-empty sections in table order
+            release_notes = '\n\n'.join(
+                header + '\n' + '\n'.join(lines)
+                for key, header in RELEASE_NOTE_SECTIONS
+                if (lines := sections[key])
+            )
             self.logger.success(f"Generated release notes ({len(commits.split())} commits)")
 
             return release_notes
@@ -396,6 +447,23 @@ class GitHubReleaseMaster:
             self.logger.warning(f"Failed to generate release notes: {e}")
             return "• See git history for changes"
 
+    @staticmethod
+    def _changelog_insert_point(content: str) -> Optional[int]:
+        """Offset of the first '## ' line, else of the fourth line; None if there is none."""
+        if content.startswith('## '):
+            return 0
+
+        header = content.find('\n## ')
+        if header >= 0:
+            return header + 1
+
+        line_end = -1
+        for _ in range(3):
+            line_end = content.find('\n', line_end + 1)
+            if line_end < 0:
+                return None
+        return line_end + 1
+
     def update_changelog(self, version: Version, release_notes: str, dry_run: bool = False) -> bool:
         """Update CHANGELOG.md with new version."""
         self.logger.step("Updating CHANGELOG.md")
@@ -417,18 +485,13 @@ class GitHubReleaseMaster:
 
 """
 
-            # Insert after the header
-            lines = content.split('\n')
-            insert_index = 3  # After title and description
-
-            # Find the right place to insert (after any existing header)
-            for i, line in enumerate(lines):
-                if line.startswith('## '):
-                    insert_index = i
-                    break
-
-            lines.insert(insert_index, new_entry)
-            updated_content = '\n'.join(lines)
+            # Insert before the first version header (or after the title and
+            # description), without splitting the whole changelog into lines
+            insert_at = self._changelog_insert_point(content)
+            if insert_at is None:
+                updated_content = f"{content}\n{new_entry}"
+            else:
+                updated_content = f"{content[:insert_at]}{new_entry}\n{content[insert_at:]}"
 
             if not dry_run:
                 changelog_path.write_text(updated_content, encoding='utf-8')
@@ -453,7 +516,7 @@ class GitHubReleaseMaster:
             self.git_repo.git.add('--all')
 
             # Check if there are changes to commit
-            if not self.git_repo.is_dirty(untracked_files=True):
+            if not self._is_dirty(untracked_files=True):
                 self.logger.warning("No changes to commit")
                 return False
 
@@ -483,32 +546,46 @@ class GitHubReleaseMaster:
         """Wait for GitHub Actions workflow to complete."""
         self.logger.step("Waiting for GitHub Actions workflow to complete")
 
+        # The release commit does not change while waiting
+        head_sha = self.git_repo.head.commit.hexsha
+        gh_repo = self.gh_repo
+        tag_name = f"v{version}"
+        run = None
         start_time = time.time()
+        delay = WORKFLOW_POLL_INITIAL_DELAY
 
         while time.time() - start_time < timeout:
             try:
-                # Get workflow runs triggered by our tag
-                workflows = self.gh_repo.get_workflow_runs()
-
-                for run in workflows:
-                    if run.head_sha == self.git_repo.head.commit.hexsha:
+                if run is None:
+                    # Find the run started by pushing our tag (for tag pushes
+                    # head_branch is the tag); GitHub filters by commit, and the
+                    # branch push's CI run on the same commit is skipped
+                    workflows = gh_repo.get_workflow_runs(event="push", head_sha=head_sha)
+                    run = next((r for r in workflows if r.head_branch == tag_name), None)
+                    if run is not None:
                         self.logger.info(f"Found workflow run: {run.html_url}")
-
-                        if run.status == "completed":
-                            if run.conclusion == "success":
-                                self.logger.success("Workflow completed successfully!")
-                                return True
-                            else:
-                                self.logger.error(f"Workflow failed with conclusion: {run.conclusion}")
-                                return False
+                else:
+                    # Re-fetch only this run, conditionally: while it is
+                    # unchanged GitHub answers 304, which costs no rate limit
+                    run.update()
+
+                if run is not None:
+                    if run.status == "completed":
+                        if run.conclusion == "success":
+                            self.logger.success("Workflow completed successfully!")
+                            return True
                         else:
-                            self.logger.info(f"Workflow status: {run.status}")
-
-                time.sleep(30)  # Wait 30 seconds before checking again
+                            self.logger.error(f"Workflow failed with conclusion: {run.conclusion}")
+                            return False
+                    else:
+                        self.logger.info(f"Workflow status: {run.status}")
 
             except Exception as e:
                 self.logger.warning(f"Error checking workflow status: {e}")
-                time.sleep(30)
+
+            # Check often while the run is starting, then back off
+            time.sleep(delay)
+            delay = min(WORKFLOW_POLL_MAX_DELAY, delay * 2)
 
         self.logger.error("Timeout waiting for workflow completion")
         return False
@@ -562,6 +639,7 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
             )
 
             self.logger.success(f"Created release: {release.html_url}")
+            self._log_rate_limit()
             return True
 
         except Exception as e:
@@ -616,22 +694,24 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
             self.logger.info("No installer directory found")
             return
 
-        # Pattern for current version files
-        current_version_patterns = [
+        # Current version files
+        keep = frozenset((
             f"LHAtoLCSC-{next_version}-Setup.exe",
             f"LHAtoLCSC-{next_version}-Portable.zip"
-        ]
+        ))
 
         try:
             removed_count = 0
-            for file in installer_dir.glob("*"):
-                if file.is_file() and file.name not in current_version_patterns:
-                    if dry_run:
-                        self.logger.info(f"Would remove: {file.name}")
-                    else:
-                        file.unlink()
-                        self.logger.success(f"Removed old installer: {file.name}")
-                    removed_count += 1
+            # scandir entries carry the file type, so is_file() needs no extra stat
+            with os.scandir(installer_dir) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.name not in keep:
+                        if dry_run:
+                            self.logger.info(f"Would remove: {entry.name}")
+                        else:
+                            os.unlink(entry.path)
+                            self.logger.success(f"Removed old installer: {entry.name}")
+                        removed_count += 1
 
             if removed_count == 0:
                 self.logger.info("No old installer files to remove")
@@ -641,8 +721,14 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
         except Exception as e:
             self.logger.warning(f"Failed to clean local installers: {e}")
 
-    def _clean_old_release_assets(self, dry_run: bool = False):
-        """Remove old installer files from previous GitHub releases."""
+    def _clean_old_release_assets(self, dry_run: bool = False,
+                                  max_releases: int = DEFAULT_MAX_CLEAN_RELEASES):
+        """Remove old installer files from previous GitHub releases.
+
+        The newest KEEP_RELEASE_ASSETS releases are left alone and only the
+        max_releases releases after them are checked; older ones were
+        cleaned by earlier runs.
+        """
         self.logger.step("Cleaning old installer assets from previous GitHub releases")
 
         if dry_run:
@@ -650,14 +736,13 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
             return
 
         try:
-            releases = list(self.gh_repo.get_releases())
+            # Releases are listed newest first and fetched page by page, so
+            # this stops after the releases it needs
+            releases = islice(self.gh_repo.get_releases(), KEEP_RELEASE_ASSETS,
+                              KEEP_RELEASE_ASSETS + max_releases)
             cleaned_releases = 0
 
             for release in releases:
-                # Skip the latest 3 releases
-                if cleaned_releases >= len(releases) - 3:
-                    continue
-
                 assets_to_remove = []
                 for asset in release.get_assets():
                     # Remove old installer files but keep wheel and tar.gz
@@ -685,13 +770,19 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
             self.logger.warning(f"Failed to clean old release assets: {e}")
 
     def perform_release(self, bump_type: str = "patch", dry_run: bool = False,
-                        force: bool = False, wait_for_assets: bool = True) -> bool:
+                        force: bool = False, wait_for_assets: bool = True,
+                        max_clean_releases: int = DEFAULT_MAX_CLEAN_RELEASES) -> bool:
         """Perform the complete release process."""
         self.logger.header(f"Starting {bump_type.upper()} Release Process")
 
         if dry_run:
             self.logger.warning("DRY RUN MODE - No changes will be made")
 
+        # Stop before touching any files if the release could run out of API
+        # quota halfway (after the push)
+        if not self._has_api_quota():
+            return False
+
         try:
             # 1. Calculate next version
             next_version = self.calculate_next_version(bump_type)
@@ -704,7 +795,7 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
                 return False
 
             # 3. Check working directory
-            if self.git_repo.is_dirty() and not force:
+            if self._is_dirty() and not force:
                 self.logger.error("Working directory is dirty! Commit changes first or use --force")
                 return False
 
@@ -739,7 +830,8 @@ See [README.md](https://github.com/{self.repo_name}/blob/main/README.md) for ful
                 self.verify_release_assets(next_version)
 
             # 11. Clean old installer assets from previous releases
-            self._clean_old_release_assets(dry_run)
+            self._clean_old_release_assets(dry_run, max_clean_releases)
+            self._log_rate_limit()
 
             self.logger.header("🎉 Release Complete!")
             self.logger.success(f"Successfully released v{next_version}")
@@ -794,6 +886,14 @@ Examples:
         help="Don't wait for GitHub Actions to complete"
     )
 
+    parser.add_argument(
+        "--max-clean-releases",
+        type=int,
+        default=DEFAULT_MAX_CLEAN_RELEASES,
+        help=f"Number of older releases to clean installer assets from "
+             f"(after the newest {KEEP_RELEASE_ASSETS}, default: {DEFAULT_MAX_CLEAN_RELEASES})"
+    )
+
     parser.add_argument(
         "--github-token",
         help="GitHub token (defaults to GITHUB_TOKEN env var or git config)"
@@ -810,7 +910,8 @@ Examples:
             bump_type=args.bump_type,
             dry_run=args.dry_run,
             force=args.force,
-            wait_for_assets=not args.no_wait
+            wait_for_assets=not args.no_wait,
+            max_clean_releases=args.max_clean_releases
         )
 
         sys.exit(0 if success else 1)